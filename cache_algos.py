@@ -0,0 +1,136 @@
+# Copyright 2025 Amit Joshi
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Author: Amit Joshi
+# Email 1: amitjoshi2724@gmail.com
+# Email 2: amit.joshiusa@gmail.com
+# GitHub: https://github.com/amitjoshi2724
+
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+from scheduling_algos import _as_columns, gpi_weighted_job_scheduling_columnar
+
+# Bytes charged per cache entry on top of the stored selection (key, tuple, dict slot)
+ENTRY_OVERHEAD = 200
+
+
+# Canonical columns of an instance: int64/float64 columns with the times shifted so the
+# earliest one is 0. The optimum and the selected indices only depend on the relative
+# order of the times, so time-shifted copies of an instance share a canonical form.
+# Float times are only shifted when the shift is exact, so distinct times never merge.
+def canonical_columns(starts, ends=None, weights=None):
+    starts, ends, weights = _as_columns(starts, ends, weights)
+    starts, ends, weights = (column.astype(np.int64 if column.dtype.kind in 'iub' else np.float64, copy=False)
+                             for column in (starts, ends, weights))
+    if len(starts):
+        origin = min(starts.min(), ends.min())
+        shifted_starts, shifted_ends = starts - origin, ends - origin
+        if starts.dtype.kind == 'i' and ends.dtype.kind == 'i':
+            starts, ends = shifted_starts, shifted_ends
+        elif np.array_equal(shifted_starts + origin, starts) and np.array_equal(shifted_ends + origin, ends):
+            starts, ends = shifted_starts, shifted_ends
+    return starts, ends, weights
+
+
+# 128-bit content hash of the canonical instance, computed over the raw column buffers
+# in O(n) with BLAKE2b (no per-job Python hashing)
+def instance_key(starts, ends=None, weights=None):
+    starts, ends, weights = canonical_columns(starts, ends, weights)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{len(starts)}|{starts.dtype.str}|{ends.dtype.str}|{weights.dtype.str}".encode())
+    for column in (starts, ends, weights):
+        digest.update(np.ascontiguousarray(column).data)
+    return digest.digest()
+
+
+# Opt-in LRU cache of solver results keyed by instance_key together with the solver, its
+# sortAlgo and any other arguments (backends differ in result types and in the inputs
+# they accept, so results are never shared between them), bounded by bytes: each
+# entry is charged ENTRY_OVERHEAD plus the size of its stored selection, and the least
+# recently used entries are evicted once the total exceeds max_bytes. Repeated or
+# time-shifted instances are answered from the cache; hits, misses and evictions are
+# counted. A hit that needs the selection when only the optimum was cached is a miss.
+class SolverCache:
+    def __init__(self, max_bytes=64 << 20):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (optimum, selected or None, nbytes)
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'entries': len(self._entries), 'nbytes': self.nbytes, 'max_bytes': self.max_bytes}
+
+    def clear(self):
+        self._entries.clear()
+        self.nbytes = 0
+
+    # Cached gpi_weighted_job_scheduling_columnar (same arguments and results)
+    def solve(self, starts, ends=None, weights=None, sortAlgo='default', return_jobs=False):
+        starts, ends, weights = _as_columns(starts, ends, weights)
+        key = (instance_key(starts, ends, weights), 'columnar', sortAlgo)
+        return self._lookup(key, return_jobs,
+                            lambda: gpi_weighted_job_scheduling_columnar(starts, ends, weights, sortAlgo, return_jobs))
+
+    # Cached version of a list solver such as gpi_weighted_job_scheduling or
+    # classical_weighted_interval_scheduling (same arguments and results). The wrapped
+    # solver gets its own copy of jobs, since the classical solver sorts it in place.
+    # Keyword arguments such as presorted or memory_lean are passed through.
+    def wrap(self, solver):
+        name = f"{solver.__module__}.{solver.__qualname__}"
+
+        def cached_solver(jobs, sortAlgo='default', return_jobs=False, **kwargs):
+            key = (instance_key(np.asarray(jobs).reshape(-1, 3)), name, sortAlgo, tuple(sorted(kwargs.items())))
+            result = self._lookup(key, return_jobs, lambda: solver(list(jobs), sortAlgo, return_jobs, **kwargs))
+            return (result[0], result[1].tolist()) if return_jobs else result
+        cached_solver.__name__ = f"cached_{solver.__name__}"
+        return cached_solver
+
+    def _lookup(self, key, return_jobs, solve):
+        entry = self._entries.get(key)
+        if entry is not None and (entry[1] is not None or not return_jobs):
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return (entry[0], entry[1].copy()) if return_jobs else entry[0]
+
+        self.misses += 1
+        result = solve()
+        if return_jobs:
+            optimum, selected = result[0], np.asarray(result[1], dtype=np.int64)
+            result = (optimum, selected.copy())
+        else:
+            optimum, selected = result, None
+        self._store(key, optimum, selected)
+        return result
+
+    def _store(self, key, optimum, selected):
+        nbytes = ENTRY_OVERHEAD + (selected.nbytes if selected is not None else 0)
+        if key in self._entries:
+            self.nbytes -= self._entries.pop(key)[2]
+        if nbytes > self.max_bytes:
+            return
+        self._entries[key] = (optimum, selected, nbytes)
+        self.nbytes += nbytes
+        while self.nbytes > self.max_bytes:
+            _, (_, _, evicted) = self._entries.popitem(last=False)
+            self.nbytes -= evicted
+            self.evictions += 1
@@ -0,0 +1,230 @@
+# Copyright 2025 Amit Joshi
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Author: Amit Joshi
+# Email 1: amitjoshi2724@gmail.com
+# Email 2: amit.joshiusa@gmail.com
+# GitHub: https://github.com/amitjoshi2724
+
+import os
+import tempfile
+
+import numpy as np
+
+from scheduling_algos import _argsort, _streaming_predecessors, _traceback, _zero_length_tie_order
+
+# On-disk job record: a flat binary file of these, e.g. written by write_job_file
+JOB_DTYPE = np.dtype([('start', '<f8'), ('end', '<f8'), ('weight', '<f8')])
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+# Write jobs (an iterable of (start, end, weight) tuples, or a structured array) to a
+# job file, chunk_size records at a time; returns the number of jobs written
+def write_job_file(path, jobs, dtype=JOB_DTYPE, chunk_size=DEFAULT_CHUNK_SIZE):
+    dtype = np.dtype(dtype)
+    n = 0
+    with open(path, 'wb') as f:
+        if isinstance(jobs, np.ndarray) and jobs.dtype.names:
+            jobs.astype(dtype, copy=False).tofile(f)
+            return len(jobs)
+        chunk = []
+        for job in jobs:
+            chunk.append(tuple(job))
+            if len(chunk) == chunk_size:
+                np.array(chunk, dtype=dtype).tofile(f)
+                n += len(chunk)
+                chunk = []
+        if chunk:
+            np.array(chunk, dtype=dtype).tofile(f)
+            n += len(chunk)
+    return n
+
+
+# Read-only memmap over a job file; the OS pages records in as they are touched
+def open_job_file(path, dtype=JOB_DTYPE):
+    if os.path.getsize(path) == 0:
+        return np.zeros(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='r')
+
+
+def _chunks(records, chunk_size):
+    for lo in range(0, len(records), chunk_size):
+        yield lo, np.array(records[lo:lo + chunk_size])
+
+
+# External sort of a stream of record chunks by one field into a memmap at `path`.
+# Each chunk is sorted in memory (with the same backends as the columnar solver) and
+# written as a sorted run; the runs are then combined with a single k-way merge.
+def _external_sort(chunks, n, dtype, key, path, chunk_size, sortAlgo, workdir):
+    runs_path = os.path.join(workdir, os.path.basename(path) + '.runs')
+    bounds = []
+    with open(runs_path, 'wb') as f:
+        for chunk in chunks:
+            chunk[_argsort(chunk[key], sortAlgo)].tofile(f)
+            lo = bounds[-1][1] if bounds else 0
+            bounds.append((lo, lo + len(chunk)))
+
+    if len(bounds) <= 1:
+        os.replace(runs_path, path)
+        return np.memmap(path, dtype=dtype, mode='r+', shape=(n,))
+
+    runs = np.memmap(runs_path, dtype=dtype, mode='r', shape=(n,))
+    out = np.memmap(path, dtype=dtype, mode='w+', shape=(n,))
+    _merge_runs(runs, bounds, key, out, max(1, chunk_size // len(bounds)))
+    del runs
+    os.remove(runs_path)
+    return out
+
+
+# k-way merge of sorted runs runs[lo:hi] into out, one block per run in memory.
+# Every buffered record with key <= the smallest buffer tail can be emitted: no
+# record still on disk sorts before it. The run owning that tail empties each round.
+def _merge_runs(runs, bounds, key, out, block):
+    cursors = [lo for lo, _ in bounds]
+    buffers = [np.array(runs[lo:min(lo + block, hi)]) for lo, hi in bounds]
+    for r, (lo, hi) in enumerate(bounds):
+        cursors[r] = min(lo + block, hi)
+    active = list(range(len(bounds)))
+    pos = 0
+    while active:
+        bound = min(buffers[r][key][-1] for r in active)
+        pieces = []
+        for r in active:
+            take = np.searchsorted(buffers[r][key], bound, side='right')
+            pieces.append(buffers[r][:take])
+            buffers[r] = buffers[r][take:]
+        merged = np.concatenate(pieces)
+        out[pos:pos + len(merged)] = merged[np.argsort(merged[key], kind='stable')]
+        pos += len(merged)
+
+        still_active = []
+        for r in active:
+            if not len(buffers[r]):
+                hi = bounds[r][1]
+                buffers[r] = np.array(runs[cursors[r]:min(cursors[r] + block, hi)])
+                cursors[r] += len(buffers[r])
+            if len(buffers[r]):
+                still_active.append(r)
+        active = still_active
+
+
+# Moves zero-length jobs behind the other jobs with the same end (see _zero_length_last)
+# in an end-sorted memmap, in place, a block of about chunk_size records at a time. Each
+# block is extended to the end of its last equal-end group, so no group is split.
+def _zero_length_last_external(by_end, chunk_size):
+    lo = 0
+    while lo < len(by_end):
+        hi = min(lo + chunk_size, len(by_end))
+        last_end = by_end['end'][hi - 1]
+        while hi < len(by_end):
+            following = np.array(by_end['end'][hi:hi + chunk_size])
+            tied = int(np.searchsorted(following, last_end, side='right'))
+            hi += tied
+            if tied < len(following):
+                break
+        block = np.array(by_end[lo:hi])
+        tie_order = _zero_length_tie_order(block['start'], block['end'])
+        if tie_order is not None:
+            by_end[lo:hi] = block[tie_order]
+        lo = hi
+
+
+# GPI DP over end-ordered weights with 0-indexed predecessors p, into dp (length n + 1),
+# a chunk of p and weights at a time. Reads of dp[p] go through the memmap.
+def _external_dp(p, weights, dp, chunk_size):
+    dp[0] = 0
+    dp_view = memoryview(dp)
+    best = dp_view[0]
+    i = 0
+    for lo in range(0, len(p), chunk_size):
+        p_chunk = np.array(p[lo:lo + chunk_size])
+        weight_chunk = np.array(weights[lo:lo + chunk_size], dtype=dp.dtype)
+        for pred, weight in zip(memoryview(p_chunk), memoryview(weight_chunk)):
+            include = weight + dp_view[pred]
+            if include > best:
+                best = include
+            i += 1
+            dp_view[i] = best
+    return best
+
+
+# Out-of-core GPI for job files larger than RAM. The jobs are read from `path` in chunks
+# of chunk_size records and go through the same steps as the columnar solver, with every
+# O(n) array on disk:
+#   1. external sort by end (sorted runs + k-way merge), tagging each job with its index,
+#      with zero-length jobs last among equal ends;
+#   2. external sort of (start, end rank) pairs by start;
+#   3. streaming GPI merge of the two sorted files into p, scattered into a memmap;
+#   4. the DP, with dp in a memmap.
+# Peak memory is O(chunk_size) records; the temporary files (about 3x the input) go in
+# `workdir`, a fresh temporary directory by default. Returns the optimum, and with
+# return_jobs=True also the selected jobs as indices into the file.
+def gpi_weighted_job_scheduling_external(path, dtype=JOB_DTYPE, chunk_size=DEFAULT_CHUNK_SIZE, sortAlgo='default',
+                                         return_jobs=False, workdir=None):
+    jobs = open_job_file(path, dtype)
+    n = len(jobs)
+    if n == 0:
+        return (0, np.empty(0, dtype=np.int64)) if return_jobs else 0
+    weight_kind = jobs.dtype['weight'].kind
+    dp_dtype = np.int64 if weight_kind in 'iub' else np.float64
+
+    with tempfile.TemporaryDirectory(dir=workdir) as tmp:
+        # 1. End order, with each job's index in the input file
+        by_end_dtype = np.dtype(jobs.dtype.descr + [('index', '<i8')])
+
+        def tagged_chunks():
+            for lo, chunk in _chunks(jobs, chunk_size):
+                tagged = np.empty(len(chunk), dtype=by_end_dtype)
+                for name in jobs.dtype.names:
+                    tagged[name] = chunk[name]
+                tagged['index'] = np.arange(lo, lo + len(chunk))
+                yield tagged
+
+        by_end = _external_sort(tagged_chunks(), n, by_end_dtype, 'end', os.path.join(tmp, 'by_end'),
+                                chunk_size, sortAlgo, tmp)
+        _zero_length_last_external(by_end, chunk_size)
+
+        # 2. Start order, remembering each start's position in the end order
+        by_start_dtype = np.dtype([('start', jobs.dtype['start']), ('rank', '<i8')])
+
+        def ranked_chunks():
+            for lo, chunk in _chunks(by_end, chunk_size):
+                ranked = np.empty(len(chunk), dtype=by_start_dtype)
+                ranked['start'] = chunk['start']
+                ranked['rank'] = np.arange(lo, lo + len(chunk))
+                yield ranked
+
+        by_start = _external_sort(ranked_chunks(), n, by_start_dtype, 'start', os.path.join(tmp, 'by_start'),
+                                  chunk_size, sortAlgo, tmp)
+
+        # 3. p[rank] = number of ends <= start, i.e. the 1-indexed predecessor, at most
+        #    rank (the job before it in end order, see _cap_predecessors)
+        p = np.memmap(os.path.join(tmp, 'p'), dtype=np.int64, mode='w+', shape=(n,))
+        for lo, counts in _streaming_predecessors(by_end['end'], by_start['start'], chunk_size):
+            ranks = np.array(by_start['rank'][lo:lo + len(counts)])
+            p[ranks] = np.minimum(counts, ranks)
+
+        # 4. DP
+        dp = np.memmap(os.path.join(tmp, 'dp'), dtype=dp_dtype, mode='w+', shape=(n + 1,))
+        optimum = _external_dp(p, by_end['weight'], dp, chunk_size)
+
+        if return_jobs:
+            p_view = memoryview(p)
+            selected = _traceback(memoryview(dp), lambda i: p_view[i - 1])
+            positions = np.frombuffer(selected, dtype=np.int64) - 1
+            selected = np.array(by_end['index'][positions])
+        del by_end, by_start, p, dp  # release the memmaps before the directory is removed
+
+    return (optimum, selected) if return_jobs else optimum
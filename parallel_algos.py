@@ -0,0 +1,178 @@
+# Copyright 2025 Amit Joshi
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Author: Amit Joshi
+# Email 1: amitjoshi2724@gmail.com
+# Email 2: amit.joshiusa@gmail.com
+# GitHub: https://github.com/amitjoshi2724
+
+import atexit
+import os
+from itertools import chain
+from multiprocessing import get_context, resource_tracker, shared_memory
+
+import numpy as np
+
+from scheduling_algos import _as_columns, gpi_weighted_job_scheduling_columnar
+
+# Target number of chunks per worker, so that uneven instance sizes still balance
+CHUNKS_PER_WORKER = 4
+
+
+# Pack instances into one columnar batch: offsets (k + 1) and the starts, ends and
+# weights of every instance back to back. Columns are widened to 8-byte int64 or
+# float64 so they can sit in a single shared buffer without alignment padding.
+def _pack(instances):
+    if all(isinstance(jobs, (list, tuple)) for jobs in instances):
+        # One conversion for the whole batch instead of one per instance
+        sizes = [len(jobs) for jobs in instances]
+        packed = np.array(list(chain.from_iterable(instances)))
+        columns = (packed[:, 0], packed[:, 1], packed[:, 2]) if len(packed) else (packed,) * 3
+    else:
+        parts = [_as_columns(jobs) if len(jobs) else (np.zeros(0),) * 3 for jobs in instances]
+        sizes = [len(part[0]) for part in parts]
+        columns = tuple(np.concatenate([part[c] for part in parts]) for c in range(3))
+
+    offsets = np.zeros(len(instances) + 1, dtype=np.int64)
+    np.cumsum(sizes, out=offsets[1:])
+    return offsets, tuple(column.astype(np.int64 if column.dtype.kind in 'iub' else np.float64, copy=False)
+                          for column in columns)
+
+
+# Byte layout of a batch in shared memory: [(dtype, offset, length)] for the offsets,
+# starts, ends, weights and results arrays, plus the total size
+def _layout(k, total, dtypes):
+    sections = []
+    nbytes = 0
+    for dtype, length in zip((np.int64,) + dtypes + (dtypes[2],), (k + 1, total, total, total, k)):
+        sections.append((np.dtype(dtype).str, nbytes, length))
+        nbytes += np.dtype(dtype).itemsize * length
+    return sections, max(nbytes, 1)
+
+
+def _views(buf, sections):
+    return [np.ndarray(length, dtype=dtype, buffer=buf, offset=offset) for dtype, offset, length in sections]
+
+
+def _attach(name):
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+# Solve instances lo..hi-1 of a packed batch, writing each optimum into results[i]
+def _solve_range(offsets, starts, ends, weights, results, lo, hi, sortAlgo):
+    for i in range(lo, hi):
+        a, b = offsets[i], offsets[i + 1]
+        results[i] = gpi_weighted_job_scheduling_columnar(starts[a:b], ends[a:b], weights[a:b], sortAlgo=sortAlgo)
+
+
+# Pool task: attach to the batch by name and solve one chunk in place. Only the
+# segment name, the layout and the chunk bounds are pickled.
+def _solve_chunk(task):
+    name, sections, lo, hi, sortAlgo = task
+    shm = _attach(name)
+    try:
+        views = _views(shm.buf, sections)
+        _solve_range(*views, lo, hi, sortAlgo)
+        del views  # release the exported buffer before closing
+    finally:
+        shm.close()
+    return hi - lo
+
+
+# Split instances into contiguous chunks of roughly equal job counts
+def _chunk_bounds(offsets, n_chunks):
+    k = len(offsets) - 1
+    targets = np.linspace(0, offsets[-1], n_chunks + 1)[1:-1]
+    cuts = np.searchsorted(offsets, targets, side='left')
+    bounds = np.unique(np.concatenate(([0], cuts, [k])))
+    return list(zip(bounds[:-1].tolist(), bounds[1:].tolist()))
+
+
+# Batch GPI solver on a persistent process pool. Instances are packed into one
+# columnar buffer in multiprocessing.shared_memory; workers read their chunk of
+# instances from it zero-copy and write the optima back into it, so no job data is
+# pickled. Results come back in input order.
+class BatchSolver:
+    def __init__(self, workers=None):
+        self.workers = workers or os.cpu_count() or 1
+        self._pool = None
+        if self.workers > 1:
+            # Workers must share the parent's resource tracker; one started lazily in each
+            # worker would report the parent's segments as leaked when it exits
+            resource_tracker.ensure_running()
+            self._pool = get_context().Pool(self.workers)
+
+    def solve_many(self, instances, sortAlgo='default'):
+        instances = list(instances)
+        if not instances:
+            return []
+        offsets, (starts, ends, weights) = _pack(instances)
+        k = len(instances)
+
+        if self._pool is None:
+            results = np.zeros(k, dtype=weights.dtype)
+            _solve_range(offsets, starts, ends, weights, results, 0, k, sortAlgo)
+            return results.tolist()
+
+        sections, nbytes = _layout(k, len(starts), (starts.dtype, ends.dtype, weights.dtype))
+        shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        try:
+            views = _views(shm.buf, sections)
+            for view, column in zip(views, (offsets, starts, ends, weights)):
+                view[:] = column
+            tasks = [(shm.name, sections, lo, hi, sortAlgo)
+                     for lo, hi in _chunk_bounds(offsets, self.workers * CHUNKS_PER_WORKER)]
+            for _ in self._pool.imap_unordered(_solve_chunk, tasks):
+                pass
+            results = views[-1].tolist()
+            del views
+        finally:
+            shm.close()
+            shm.unlink()
+        return results
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+_solvers = {}
+
+
+@atexit.register
+def _close_solvers():
+    for solver in _solvers.values():
+        solver.close()
+    _solvers.clear()
+
+
+# Solve many independent instances (each a list of (start, end, weight) tuples or an
+# array accepted by the columnar solver) in parallel; returns their optima in order.
+# The worker pool is created on first use and reused by later calls.
+def solve_many(instances, workers=None, sortAlgo='default'):
+    workers = workers or os.cpu_count() or 1
+    if workers not in _solvers:
+        _solvers[workers] = BatchSolver(workers)
+    return _solvers[workers].solve_many(instances, sortAlgo)
@@ -1,7 +1,7 @@
 import matplotlib.pyplot as plt
 import os
 
-def make_plots(EXP_TITLE, GPI_SORT, results_classic, results_gpi_tim, results_gpi_linear):
+def make_plots(EXP_TITLE, GPI_SORT, results_classic, results_gpi_tim, results_gpi_linear, memory_results=None):
     # Create figures directory if it doesn't exist
     figures_dir = "figures"
     if not os.path.exists(figures_dir):
@@ -44,5 +44,32 @@ def make_plots(EXP_TITLE, GPI_SORT, results_classic, results_gpi_tim, results_gp
     plt.tight_layout()
     plt.savefig(os.path.join(figures_dir, EXP_TITLE.replace(' ', '_') + "_runtime_per_job.pdf"))
 
+    if memory_results is not None:
+        make_memory_plots(EXP_TITLE, GPI_SORT, memory_results, figures_dir, MARKER_SIZE)
+
     # Comment out line below if you don't want to see plots
     #plt.show()
+
+# Memory plots: peak traced memory, peak live allocated blocks and peak RSS growth per
+# algorithm, from run_experiment's memory_results ({name: [(n, traced, blocks, rss, phases)]})
+def make_memory_plots(EXP_TITLE, GPI_SORT, memory_results, figures_dir="figures", MARKER_SIZE=4):
+    labels = {'classic': ('Classical', 'o'), 'gpi_linear': (f'GPI Linear {GPI_SORT}', '^'), 'gpi_tim': ('GPI (Timsort)', 's')}
+    metrics = [(1, 'Peak Traced Memory (MiB)', 2**20), (2, 'Peak Allocated Blocks', 1), (3, 'Peak RSS Growth (MiB)', 2**20)]
+
+    fig, axes = plt.subplots(1, len(metrics), figsize=(16, 5))
+    for ax, (column, ylabel, scale) in zip(axes, metrics):
+        for name in ('classic', 'gpi_linear', 'gpi_tim'):
+            if not memory_results.get(name):
+                continue
+            label, marker = labels[name]
+            ns = [row[0] for row in memory_results[name]]
+            values = [row[column] / scale for row in memory_results[name]]
+            ax.plot(ns, values, marker=marker, markersize=MARKER_SIZE, label=label)
+        ax.set_xlabel('Number of Jobs (n)', fontsize=12)
+        ax.set_ylabel(ylabel, fontsize=12)
+        ax.grid(True)
+    axes[0].legend(fontsize=10, markerscale=1.5)
+    fig.suptitle('Memory Comparison: ' + EXP_TITLE)
+    fig.tight_layout()
+    fig.savefig(os.path.join(figures_dir, EXP_TITLE.replace(' ', '_') + "_memory.pdf"))
+
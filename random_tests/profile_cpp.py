@@ -51,6 +51,22 @@ def profile_cpp_function():
         print(f"  Original time: {original_time:.2f} μs")
         print(f"  Optimized time: {optimized_time:.2f} μs")
         print(f"  Speedup: {original_time/optimized_time:.2f}x")
+
+        # Fused GPI kernel: list of tuples vs. NumPy columns read through the buffer protocol
+        jobs_array = np.array(jobs)
+        start_time = time.time()
+        list_answer = boost_spreadsort.gpi_solve(jobs)
+        end_time = time.time()
+        gpi_list_time = (end_time - start_time) * 1000000
+
+        start_time = time.time()
+        array_answer = boost_spreadsort.gpi_solve(jobs_array[:, 0], jobs_array[:, 1], jobs_array[:, 2])
+        end_time = time.time()
+        gpi_array_time = (end_time - start_time) * 1000000
+
+        assert list_answer == array_answer
+        print(f"  gpi_solve (list) time: {gpi_list_time:.2f} μs")
+        print(f"  gpi_solve (NumPy) time: {gpi_array_time:.2f} μs")
         print("-" * 50)
         print()
 
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import random
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import scheduling_algos
+from scheduling_algos import (choose_argsort_algo, choose_sort_algo, classical_weighted_interval_scheduling,
+                              gpi_weighted_job_scheduling, gpi_weighted_job_scheduling_columnar,
+                              gpi_weighted_job_scheduling_multi, profile_sort_keys)
+
+rng = np.random.default_rng(2724)
+n = 1 << 17
+
+# The profile reads a bounded sample and reports what it saw
+cases = {
+    'narrow integers': (rng.integers(0, 10**6, n), 'radix'),
+    'wide integers': (rng.integers(-2**62, 2**62, n), 'integer spread'),
+    'few integers': (rng.integers(0, 10**6, 1000), 'integer spread'),
+    'uint64': (rng.integers(0, 2**64 - 1, 1000, dtype=np.uint64), 'radix'),
+    'uniform floats': (rng.uniform(0, 1e6, n), 'bucket'),
+    'normal floats': (rng.normal(0, 1e3, n), 'bucket'),
+    'few floats': (rng.uniform(0, 1e6, 1000), 'spread'),
+    'clustered floats': (rng.lognormal(0, 3, n), 'spread'),
+    'many clustered floats': (rng.lognormal(0, 3, 1 << 20), 'sample'),
+    'sorted floats': (np.sort(rng.uniform(0, 1e6, n)), 'default'),
+    'nearly sorted floats': (np.sort(rng.uniform(0, 1e6, n)) + rng.uniform(0, 50, n), 'default'),
+    'sorted integers': (np.arange(n), 'default'),
+}
+for name, (keys, expected) in cases.items():
+    sortAlgo, stats = choose_argsort_algo(keys)
+    if sortAlgo != expected:
+        print(f"✗ {name}: chose {sortAlgo}, expected {expected} ({stats})")
+        sys.exit(1)
+    if scheduling_algos.last_auto_sort != (sortAlgo, stats):
+        print(f"✗ {name}: last_auto_sort not recorded")
+        sys.exit(1)
+    if stats['sample'] > scheduling_algos.AUTO_SAMPLE_SIZE or stats['n'] != len(keys):
+        print(f"✗ {name}: profile read {stats['sample']} keys")
+        sys.exit(1)
+    perm = scheduling_algos._argsort(keys, 'auto')
+    if not np.array_equal(keys[perm], np.sort(keys)):
+        print(f"✗ {name}: auto argsort is not sorted")
+        sys.exit(1)
+
+uniform = profile_sort_keys(rng.uniform(0, 1, n))
+clustered = profile_sort_keys(rng.lognormal(0, 3, n))
+if not (0.5 < uniform['occupancy'] < 0.75 and clustered['occupancy'] < 0.2 and clustered['max_load'] > 10 * uniform['max_load']):
+    print(f"✗ Bucket statistics do not separate uniform from clustered keys: {uniform}, {clustered}")
+    sys.exit(1)
+print("✓ Profiles and argsort decisions")
+
+# Fused solvers: integer spread only for integer times, with a fallback for unsampled floats
+jobs = [(i, i + 2, 1) for i in range(5000)]
+if choose_sort_algo(jobs)[0] != 'integer spread' or choose_sort_algo([(0.5, 1, 1)])[0] != 'spread':
+    print("✗ Wrong fused backend for list input")
+    sys.exit(1)
+if choose_sort_algo([(2**70, 2**70 + 1, 1)])[0] != 'spread':
+    print("✗ Times beyond int64 must not use integer spread")
+    sys.exit(1)
+jobs[1] = (1.5, 3.5, 1)  # not at a sampled position
+optimum = gpi_weighted_job_scheduling(list(jobs), sortAlgo='auto')
+if optimum != classical_weighted_interval_scheduling(list(jobs)) or scheduling_algos.last_auto_sort[0] != 'spread':
+    print(f"✗ Unsampled float time: got {optimum} with {scheduling_algos.last_auto_sort[0]}")
+    sys.exit(1)
+if scheduling_algos.last_auto_sort[1].get('rejected') != 'integer spread':
+    print(f"✗ Fallback from integer spread not recorded: {scheduling_algos.last_auto_sort}")
+    sys.exit(1)
+try:
+    gpi_weighted_job_scheduling(list(jobs), sortAlgo='integer spread')
+except TypeError:
+    pass
+else:
+    print("✗ Explicit integer spread accepted a float time")
+    sys.exit(1)
+print("✓ Fused backend decisions")
+
+# Every solver accepts sortAlgo='auto' and agrees with the classical solver
+random.seed(2724)
+for trial in range(300):
+    size = random.choice([0, 1, 5, 50, 400])
+    fractional = random.random() < 0.4
+    presorted = random.random() < 0.3
+    jobs = []
+    for _ in range(size):
+        start = random.uniform(0, 100) if fractional else random.randint(0, 100)
+        jobs.append((start, start + random.randint(1, 15), random.randint(1, 20)))
+    if presorted:
+        jobs.sort()
+    expected = classical_weighted_interval_scheduling(list(jobs))
+    arr = np.array(jobs).reshape(-1, 3) if fractional else np.array(jobs, dtype=np.int64).reshape(-1, 3)
+    results = {
+        'list': gpi_weighted_job_scheduling(list(jobs), sortAlgo='auto'),
+        'lean': gpi_weighted_job_scheduling(list(jobs), sortAlgo='auto', memory_lean=True),
+        'columnar': gpi_weighted_job_scheduling_columnar(arr, sortAlgo='auto'),
+        'single sort': gpi_weighted_job_scheduling_columnar(arr, sortAlgo='auto', single_sort=True),
+        'multi': gpi_weighted_job_scheduling_multi(arr[:, 0], arr[:, 1], arr[:, 2:], sortAlgo='auto')[0] if size else 0,
+    }
+    for name, result in results.items():
+        if result != expected:
+            print(f"✗ Trial {trial} ({name}): expected {expected}, got {result}")
+            sys.exit(1)
+    optimum, selected = gpi_weighted_job_scheduling(list(jobs), sortAlgo='auto', return_jobs=True)
+    chosen = sorted((jobs[i] for i in selected), key=lambda job: job[1])
+    if sum(job[2] for job in chosen) != expected or any(a[1] > b[0] for a, b in zip(chosen, chosen[1:])):
+        print(f"✗ Trial {trial}: schedule is not optimal")
+        sys.exit(1)
+print("✓ All solvers agree with the classical solver under sortAlgo='auto'")
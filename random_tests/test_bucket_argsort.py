@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import random
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from scheduling_algos import bucket_argsort, bucket_sort
+
+rng = np.random.default_rng(2724)
+cases = {
+    'uniform': rng.uniform(0, 1e6, 20000),
+    'normal': rng.normal(0, 1e3, 20000),
+    'heavy tail': rng.lognormal(0, 4, 20000),
+    'integers': rng.integers(-10**12, 10**12, 20000),
+    'duplicates': rng.integers(0, 30, 20000),
+    'big integers': np.array([random.randint(-2**80, 2**80) for _ in range(2000)], dtype=object),
+    'with infinity': np.append(rng.uniform(0, 1, 100), [np.inf, -np.inf]),
+    'equal': np.full(50, 7.5),
+    'single': np.array([1.0]),
+    'empty': np.array([], dtype=np.float64),
+}
+for name, keys in cases.items():
+    expected = np.argsort(keys, kind='stable')
+    for load_factor in (0.25, 1, 3.5, 64):
+        perm = bucket_argsort(keys, load_factor)
+        if perm.dtype != np.int64 or not np.array_equal(perm, expected):
+            print(f"✗ {name}, load factor {load_factor}: not the stable sorting permutation")
+            sys.exit(1)
+print("✓ Bucket argsort is stable and exact for every load factor")
+
+random.seed(2724)
+for trial in range(200):
+    jobs = [(random.uniform(0, 100), random.uniform(0, 100), k) for k in range(random.randint(0, 300))]
+    for key_index in (0, 1):
+        expected = sorted(jobs, key=lambda job: job[key_index])
+        if bucket_sort(jobs, key_index, load_factor=random.choice([0.5, 1, 4])) != expected:
+            print(f"✗ Trial {trial}: bucket_sort by key {key_index} differs from a stable sort")
+            sys.exit(1)
+print("✓ bucket_sort matches a stable sort of the jobs")
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import random
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from scheduling_algos import classical_weighted_interval_scheduling, gpi_weighted_job_scheduling_columnar
+
+def random_jobs(n, max_val=50):
+    jobs = [(random.randint(0, max_val), random.randint(0, max_val), random.randint(1, 100)) for _ in range(n)]
+    return [(min(s, e), max(s, e) + (s == e), w) for s, e, w in jobs]
+
+random.seed(2724)
+for trial in range(200):
+    jobs = random_jobs(random.randint(0, 100))
+    expected = classical_weighted_interval_scheduling(list(jobs))
+    arr = np.array(jobs, dtype=np.int64).reshape(-1, 3)
+
+    structured = np.zeros(len(jobs), dtype=[('start', 'f8'), ('end', 'f8'), ('weight', 'i8')])
+    structured['start'], structured['end'], structured['weight'] = arr[:, 0], arr[:, 1], arr[:, 2]
+
+    results = [
+        gpi_weighted_job_scheduling_columnar(arr[:, 0], arr[:, 1], arr[:, 2]),
+        gpi_weighted_job_scheduling_columnar(arr),
+        gpi_weighted_job_scheduling_columnar(structured),
+        gpi_weighted_job_scheduling_columnar(arr, single_sort=True),
+        gpi_weighted_job_scheduling_columnar(arr, sortAlgo='radix', single_sort=True),
+    ]
+    if any(result != expected for result in results):
+        print(f"✗ Mismatch on trial {trial}: expected {expected}, got {results}")
+        sys.exit(1)
+
+print("✓ Columnar GPI matches the classical DP on all trials")
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import random
+import tempfile
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from scheduling_algos import classical_weighted_interval_scheduling
+from external_algos import JOB_DTYPE, write_job_file, gpi_weighted_job_scheduling_external
+
+INT_JOB_DTYPE = np.dtype([('start', '<i8'), ('end', '<i8'), ('weight', '<i8')])
+
+random.seed(2724)
+with tempfile.TemporaryDirectory() as workdir:
+    path = os.path.join(workdir, 'jobs.bin')
+    for trial in range(150):
+        n = random.randint(0, 300)
+        integer = random.random() < 0.5
+        jobs = []
+        for _ in range(n):
+            if integer:
+                start = random.randint(0, 300)
+                jobs.append((start, start + random.randint(1, 40), random.randint(1, 50)))
+            else:
+                start = random.uniform(0, 300)
+                jobs.append((start, start + random.uniform(0.1, 40), random.randint(1, 50)))
+        dtype = INT_JOB_DTYPE if integer and random.random() < 0.5 else JOB_DTYPE
+        write_job_file(path, jobs, dtype=dtype, chunk_size=7)
+
+        # Small chunks force many sorted runs and a real k-way merge
+        chunk_size = random.choice([1, 3, 5, 16, 64, 1000]) if n < 60 else random.choice([16, 64, 1000])
+        sortAlgo = random.choice(['default', 'radix'] if dtype is INT_JOB_DTYPE else ['default', 'spread'])
+        expected = classical_weighted_interval_scheduling(list(jobs))
+
+        optimum, selected = gpi_weighted_job_scheduling_external(
+            path, dtype=dtype, chunk_size=chunk_size, sortAlgo=sortAlgo, return_jobs=True, workdir=workdir)
+        if optimum != expected:
+            print(f"✗ Trial {trial} ({sortAlgo}, chunk_size={chunk_size}): expected {expected}, got {optimum}")
+            sys.exit(1)
+        chosen = sorted((jobs[i] for i in selected.tolist()), key=lambda job: job[1])
+        if sum(job[2] for job in chosen) != expected or any(a[1] > b[0] for a, b in zip(chosen, chosen[1:])):
+            print(f"✗ Trial {trial}: selected jobs are not an optimal schedule")
+            sys.exit(1)
+        if os.listdir(workdir) != ['jobs.bin']:
+            print(f"✗ Trial {trial}: temporary files left behind: {os.listdir(workdir)}")
+            sys.exit(1)
+
+print("✓ Out-of-core GPI matches the classical DP")
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import random
+import subprocess
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import scheduling_algos
+from scheduling_algos import (classical_weighted_interval_scheduling, float_radix_argsort, gpi_weighted_job_scheduling,
+                              gpi_weighted_job_scheduling_columnar)
+
+rng = np.random.default_rng(2724)
+cases = {
+    'uniform': rng.uniform(0, 1e6, 5000),
+    'mixed signs': rng.normal(0, 1e3, 5000),
+    'tiny and huge': rng.choice([-1e300, -5e-324, -0.0, 0.0, 5e-324, 1e-300, 1.0, 1e300, np.inf, -np.inf], 5000),
+    'duplicates': rng.integers(-20, 20, 5000).astype(np.float64),
+    'float32': rng.normal(0, 1e3, 5000).astype(np.float32),
+    'float16': rng.normal(0, 10, 5000).astype(np.float16),
+    'integers': rng.integers(-10**12, 10**12, 5000),
+    'booleans': rng.integers(0, 2, 5000).astype(bool),
+    'single': np.array([3.5]),
+    'empty': np.array([], dtype=np.float64),
+}
+for name, keys in cases.items():
+    perm = float_radix_argsort(keys)
+    if not np.array_equal(perm, np.argsort(keys, kind='stable')):
+        print(f"✗ {name}: float radix argsort differs from NumPy's stable argsort")
+        sys.exit(1)
+print("✓ Float radix argsort is a stable sort over IEEE-754 keys")
+
+# Solvers with the NumPy fallbacks in place of the compiled extension
+native = scheduling_algos.boost_spreadsort
+scheduling_algos.boost_spreadsort = None
+try:
+    random.seed(2724)
+    for trial in range(300):
+        fractional = random.random() < 0.6
+        jobs = []
+        for _ in range(random.randint(0, 50)):
+            start = random.uniform(-50, 50) if fractional else random.randint(-50, 50)
+            jobs.append((start, start + random.randint(1, 10), random.randint(1, 20)))
+        expected = classical_weighted_interval_scheduling(list(jobs))
+        arr = np.array(jobs, dtype=np.float64 if fractional else np.int64).reshape(-1, 3)
+        results = {
+            'gpi spread': gpi_weighted_job_scheduling(list(jobs), 'spread', return_jobs=True),
+            'gpi auto': gpi_weighted_job_scheduling(list(jobs), 'auto', return_jobs=True),
+            'columnar spread': gpi_weighted_job_scheduling_columnar(arr, sortAlgo='spread', return_jobs=True),
+            'columnar auto': gpi_weighted_job_scheduling_columnar(arr, sortAlgo='auto', return_jobs=True),
+        }
+        if not fractional:
+            results['gpi integer spread'] = gpi_weighted_job_scheduling(list(jobs), 'integer spread', return_jobs=True)
+            results['columnar integer spread'] = gpi_weighted_job_scheduling_columnar(arr, sortAlgo='integer spread',
+                                                                                      return_jobs=True)
+        for name, (optimum, selected) in results.items():
+            chosen = sorted((jobs[i] for i in list(selected)), key=lambda job: job[1])
+            if optimum != expected or sum(job[2] for job in chosen) != expected \
+                    or any(a[1] > b[0] for a, b in zip(chosen, chosen[1:])):
+                print(f"✗ Trial {trial} ({name}): expected {expected}, got {optimum}")
+                sys.exit(1)
+    flags = np.random.default_rng(2724).integers(0, 2, 1000).astype(bool)
+    for sortAlgo in ('radix', 'integer spread', 'auto'):
+        if not np.array_equal(scheduling_algos._argsort(flags, sortAlgo), np.argsort(flags, kind='stable')):
+            print(f"✗ Boolean keys with sortAlgo={sortAlgo!r} are not stably sorted")
+            sys.exit(1)
+finally:
+    scheduling_algos.boost_spreadsort = native
+print("✓ 'spread' backends match the classical DP without the compiled extension")
+
+# The module imports without the extension at all
+check = ("import sys; sys.modules['boost_spreadsort'] = None; import scheduling_algos; "
+         "assert scheduling_algos.boost_spreadsort is None; "
+         "print(scheduling_algos.gpi_weighted_job_scheduling([(1, 4, 3), (2, 6, 5), (4, 7, 2), (6, 8, 4)], 'spread'))")
+output = subprocess.run([sys.executable, '-c', check], cwd=os.path.join(os.path.dirname(__file__), '..'),
+                        capture_output=True, text=True)
+if output.returncode != 0 or output.stdout.strip() != '9':
+    print(f"✗ Import without boost_spreadsort failed: {output.stderr.strip()}")
+    sys.exit(1)
+print("✓ scheduling_algos imports and solves without boost_spreadsort")
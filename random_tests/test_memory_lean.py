@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from scheduling_algos import (classical_weighted_interval_scheduling, gpi_weighted_job_scheduling,
+                              gpi_weighted_job_scheduling_lean)
+
+random.seed(2724)
+for trial in range(200):
+    fractional = random.random() < 0.4
+    jobs = []
+    for _ in range(random.randint(0, 200)):
+        start = random.uniform(0, 100) if fractional else random.randint(0, 100)
+        jobs.append((start, start + random.randint(1, 20), random.randint(1, 9)))
+    expected = classical_weighted_interval_scheduling(list(jobs))
+
+    algorithms = ['default', 'spread', 'bucket'] + ([] if fractional else ['radix', 'integer spread'])
+    for sortAlgo in algorithms:
+        optimum, selected, footprint = gpi_weighted_job_scheduling_lean(
+            jobs, sortAlgo, return_jobs=True, return_footprint=True)
+        chosen = sorted((jobs[i] for i in selected.tolist()), key=lambda job: job[1])
+        if optimum != expected or sum(job[2] for job in chosen) != expected:
+            print(f"✗ Trial {trial} ({sortAlgo}): expected {expected}, got {optimum}")
+            sys.exit(1)
+        if any(a[1] > b[0] for a, b in zip(chosen, chosen[1:])):
+            print(f"✗ Trial {trial} ({sortAlgo}): selected jobs overlap")
+            sys.exit(1)
+        if gpi_weighted_job_scheduling(jobs, sortAlgo, memory_lean=True) != expected:
+            print(f"✗ Trial {trial} ({sortAlgo}): memory_lean=True disagrees")
+            sys.exit(1)
+        if jobs and not 0 < footprint <= 100 * len(jobs):
+            print(f"✗ Trial {trial} ({sortAlgo}): implausible footprint {footprint} for n={len(jobs)}")
+            sys.exit(1)
+
+print("✓ Memory-lean GPI matches the classical DP")
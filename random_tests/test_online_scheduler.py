@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from scheduling_algos import classical_weighted_interval_scheduling
+from streaming_algos import OnlineGPIScheduler
+
+def random_jobs(n, max_val=100):
+    jobs = [(random.randint(0, max_val), random.randint(0, max_val), random.randint(1, 100)) for _ in range(n)]
+    return [(min(s, e), max(s, e), w) for s, e, w in jobs]  # zero-length jobs included
+
+random.seed(2724)
+for trial in range(200):
+    window = random.randint(0, 5)
+    jobs = sorted(random_jobs(random.randint(1, 80), random.choice([20, 100])), key=lambda job: job[1])
+    # Each job arrives fewer than `window` positions late
+    arrivals = [job for _, job in sorted(((i + random.uniform(0, window), job) for i, job in enumerate(jobs)),
+                                         key=lambda item: item[0])]
+
+    scheduler = OnlineGPIScheduler(reorder_window=window)
+    for k, job in enumerate(arrivals):
+        scheduler.append(*job)
+        expected = classical_weighted_interval_scheduling(arrivals[:k + 1])
+        if scheduler.optimum != expected:
+            print(f"✗ Trial {trial}, after {k + 1} jobs: expected {expected}, got {scheduler.optimum}")
+            sys.exit(1)
+
+    scheduler.flush()
+    if sum(arrivals[i][2] for i in scheduler.schedule()) != scheduler.optimum:
+        print(f"✗ Trial {trial}: schedule does not add up to the optimum")
+        sys.exit(1)
+
+print("✓ Online scheduler matches a full re-solve after every append")
+
+# Equal ends in end-time order may come in any order, zero-length jobs first included
+for window in (0, 1):
+    scheduler = OnlineGPIScheduler(reorder_window=window)
+    for job in [(5, 5, 1), (1, 5, 10), (5, 5, 2), (3, 5, 4), (5, 7, 3)]:
+        scheduler.append(*job)
+    if scheduler.optimum != 16:
+        print(f"✗ Window {window}: zero-length jobs before longer jobs with the same end: expected 16, got {scheduler.optimum}")
+        sys.exit(1)
+    scheduler.flush()
+    if scheduler.optimum != 16 or sorted(scheduler.schedule()) != [0, 1, 2, 4]:
+        print(f"✗ Window {window}: wrong schedule {scheduler.schedule()}")
+        sys.exit(1)
+print("✓ Zero-length jobs committed before a longer job with the same end follow it")
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from scheduling_algos import classical_weighted_interval_scheduling
+from streaming_algos import PreparedGPIInstance
+
+random.seed(2724)
+for trial in range(200):
+    fractional = random.random() < 0.3
+    jobs = []
+    for _ in range(random.randint(0, 80)):
+        start = random.uniform(0, 100) if fractional else random.randint(0, 100)
+        jobs.append((start, start + random.randint(1, 20), random.randint(0, 9)))
+    sortAlgo = random.choice(['default', 'spread'] if fractional else ['default', 'spread', 'radix'])
+    instance = PreparedGPIInstance(jobs, sortAlgo)
+    if instance.optimum != classical_weighted_interval_scheduling(list(jobs)):
+        print(f"✗ Trial {trial}: initial optimum {instance.optimum} is wrong")
+        sys.exit(1)
+
+    for update in range(20 if jobs else 0):
+        edits = {random.randrange(len(jobs)): random.randint(0, 9) for _ in range(random.randint(1, 4))}
+        for index, weight in edits.items():
+            jobs[index] = (jobs[index][0], jobs[index][1], weight)
+        optimum = instance.update_weights(edits)
+        expected = classical_weighted_interval_scheduling(list(jobs))
+        if optimum != expected:
+            print(f"✗ Trial {trial}, update {update}: expected {expected}, got {optimum}")
+            sys.exit(1)
+        chosen = sorted((jobs[i] for i in instance.schedule()), key=lambda job: job[1])
+        if sum(job[2] for job in chosen) != expected or any(a[1] > b[0] for a, b in zip(chosen, chosen[1:])):
+            print(f"✗ Trial {trial}, update {update}: schedule is not optimal")
+            sys.exit(1)
+
+    # An edit to the last job in end order only touches the tail of dp
+    if jobs:
+        last = max(range(len(jobs)), key=lambda k: (jobs[k][1], k))
+        instance.update_weights({last: instance.weight(last) + 1})
+        if instance.recomputed > 2 + sum(job[1] == jobs[last][1] for job in jobs):
+            print(f"✗ Trial {trial}: a tail edit recomputed {instance.recomputed} dp entries")
+            sys.exit(1)
+
+print("✓ Prepared instance matches a full re-solve after every weight update")
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import random
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from scheduling_algos import (_argsort, _presortedness, _start_perm, classical_weighted_interval_scheduling,
+                              gpi_weighted_job_scheduling, gpi_weighted_job_scheduling_columnar)
+
+BACKENDS = ['default', 'radix', 'bucket', 'recursive bucket', 'spread', 'integer spread', 'auto']
+
+
+# The same jobs in the orders a feed can arrive in
+def arrangements(jobs):
+    by_end = sorted(jobs, key=lambda job: job[1])
+    runs = []
+    for k in range(3):
+        runs += by_end[k::3]
+    return {'sorted': by_end, 'reversed': by_end[::-1], 'runs': runs, 'shuffled': random.sample(jobs, len(jobs))}
+
+
+rng = np.random.default_rng(2724)
+keys = rng.integers(0, 50, 1000)
+probes = {'sorted': np.sort(keys), 'reversed': np.sort(keys)[::-1], 'runs': np.concatenate([np.sort(keys[k::5]) for k in range(5)]),
+          None: keys}
+for expected, arranged in probes.items():
+    if _presortedness(arranged) != expected:
+        print(f"✗ Probe classified {expected} keys as {_presortedness(arranged)}")
+        sys.exit(1)
+    for sortAlgo in ['default', 'radix', 'spread', 'integer spread', 'auto']:
+        perm = _argsort(arranged, sortAlgo)
+        if not np.array_equal(arranged[perm], np.sort(keys)) or len(np.unique(perm)) != len(keys):
+            print(f"✗ {sortAlgo} argsort of {expected} keys is not a sorting permutation")
+            sys.exit(1)
+print("✓ Presortedness probe and argsort over presorted keys")
+
+# Second sort from the end order: starts of short jobs read in end order are nearly sorted
+for duration, expected in ((10**4, 'near'), (10**9, None)):
+    starts = rng.integers(0, 10**9, 200000)
+    ends = starts + rng.integers(1, duration, len(starts))
+    end_perm = _argsort(ends)
+    if _presortedness(starts[end_perm]) != expected:
+        print(f"✗ Starts in end order with durations up to {duration} classified as {_presortedness(starts[end_perm])}")
+        sys.exit(1)
+    for sortAlgo in ['default', 'radix', 'spread', 'integer spread']:
+        perm = _start_perm(starts, end_perm, sortAlgo)
+        if not np.array_equal(starts[perm], np.sort(starts)) or len(np.unique(perm)) != len(starts):
+            print(f"✗ {sortAlgo} start order from the end order is not a sorting permutation")
+            sys.exit(1)
+print("✓ Start order sorted from the end order")
+
+random.seed(2724)
+for trial in range(200):
+    fractional = random.random() < 0.4
+    jobs = []
+    for _ in range(random.randint(0, 60)):
+        start = random.uniform(0, 80) if fractional else random.randint(0, 80)
+        jobs.append((start, start + random.randint(1, 12), random.randint(1, 20)))
+    expected = classical_weighted_interval_scheduling(list(jobs))
+
+    for order, arranged in arrangements(jobs).items():
+        results = {}
+        for sortAlgo in BACKENDS:
+            if sortAlgo in ('radix', 'integer spread') and fractional:
+                continue
+            results[f'gpi {sortAlgo}'] = gpi_weighted_job_scheduling(list(arranged), sortAlgo, return_jobs=True)
+            arr = np.array(arranged, dtype=np.float64 if fractional else np.int64).reshape(-1, 3)
+            results[f'columnar {sortAlgo}'] = gpi_weighted_job_scheduling_columnar(arr, sortAlgo=sortAlgo, return_jobs=True)
+        results['classical'] = classical_weighted_interval_scheduling(list(arranged), return_jobs=True)
+        if not fractional:
+            results['classical radix'] = classical_weighted_interval_scheduling(list(arranged), 'radix', return_jobs=True)
+        if order == 'sorted':
+            for sortAlgo in ('default', 'radix', 'bucket') if not fractional else ('default', 'bucket'):
+                results[f'gpi {sortAlgo} hint'] = gpi_weighted_job_scheduling(list(arranged), sortAlgo, True, presorted='end')
+                results[f'lean {sortAlgo} hint'] = gpi_weighted_job_scheduling(list(arranged), sortAlgo, True, memory_lean=True,
+                                                                               presorted='end')
+            results['classical hint'] = classical_weighted_interval_scheduling(list(arranged), return_jobs=True, presorted='end')
+
+        for name, (optimum, selected) in results.items():
+            chosen = sorted((arranged[i] for i in list(selected)), key=lambda job: job[1])
+            if optimum != expected or sum(job[2] for job in chosen) != expected \
+                    or any(a[1] > b[0] for a, b in zip(chosen, chosen[1:])):
+                print(f"✗ Trial {trial} ({order}, {name}): expected {expected}, got {optimum}")
+                sys.exit(1)
+print("✓ All solvers match the classical DP on sorted, reversed, few-run and shuffled feeds")
+
+try:
+    gpi_weighted_job_scheduling([(0, 1, 1)], presorted='start')
+except ValueError:
+    print("✓ Unknown presorted hints are rejected")
+else:
+    print("✗ presorted='start' was accepted")
+    sys.exit(1)
+
+# Integer-only backends reject float keys whether or not they are already sorted
+for arranged in ([(0.5, 2.5, 1), (1, 3, 2)], [(1, 3, 2), (0.5, 2.5, 1)]):
+    for name, solve in (('gpi', lambda jobs: gpi_weighted_job_scheduling(jobs, 'radix')),
+                        ('classical', lambda jobs: classical_weighted_interval_scheduling(jobs, 'radix'))):
+        try:
+            solve(list(arranged))
+        except TypeError:
+            continue
+        print(f"✗ {name} radix accepted float times {arranged}")
+        sys.exit(1)
+for keys in (np.array([0.5, 1.0, 2.0]), np.array([2.0, 1.0, 0.5])):
+    for sortAlgo in ('radix', 'integer spread'):
+        try:
+            _argsort(keys, sortAlgo)
+        except TypeError:
+            continue
+        print(f"✗ {sortAlgo} argsort accepted float keys {keys}")
+        sys.exit(1)
+print("✓ Integer backends reject float keys on sorted and unsorted input alike")
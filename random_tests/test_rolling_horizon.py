@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from scheduling_algos import classical_weighted_interval_scheduling
+from streaming_algos import RollingHorizonScheduler
+
+random.seed(2724)
+for trial in range(300):
+    horizon = random.randint(5, 60)
+    max_duration = random.randint(1, horizon + 10)
+    now = random.randint(0, 20)
+    scheduler = RollingHorizonScheduler(horizon, max_duration, now)
+    submitted = []
+    for tick in range(40):
+        for _ in range(random.randint(0, 6)):
+            start = random.randint(now - 5, now + horizon + 30)
+            weight = random.choice([random.randint(1, 9), random.randint(1, 9) + 0.5])
+            job = (start, start + random.randint(0, max_duration), weight)
+            scheduler.submit(*job)
+            submitted.append(job)
+        now += random.randint(0, 4)
+        scheduler.advance(now)
+
+        window = [job for job in submitted if job[0] >= now and job[1] <= now + horizon]
+        expected = classical_weighted_interval_scheduling(window)
+        if scheduler.optimum != expected:
+            print(f"✗ Trial {trial}, tick {tick}: expected {expected}, got {scheduler.optimum}")
+            sys.exit(1)
+
+print("✓ Rolling-horizon scheduler matches the classical DP at every tick")
+
+# A zero-length job exactly at the pivot belongs to the old side only
+scheduler = RollingHorizonScheduler(5, 4)
+scheduler.submit(13, 13, 1)
+for now in (8, 9, 12):
+    scheduler.advance(now)
+if scheduler.optimum != 1:
+    print(f"✗ Zero-length job at the pivot: expected 1, got {scheduler.optimum}")
+    sys.exit(1)
+print("✓ Zero-length jobs at the pivot are counted once")
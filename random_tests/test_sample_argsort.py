@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import random
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from scheduling_algos import (sample_argsort, sample_sort, gpi_weighted_job_scheduling,
+                              gpi_weighted_job_scheduling_columnar, classical_weighted_interval_scheduling)
+
+rng = np.random.default_rng(2724)
+cases = {
+    'uniform': rng.uniform(0, 1e6, 20000),
+    'heavy tail': rng.lognormal(0, 4, 20000),
+    'start burst': rng.exponential(1e8, 20000) + np.minimum(100 * rng.zipf(2.0, 20000), 10**6),
+    'negative floats': rng.normal(0, 1e3, 20000),
+    'float32': rng.lognormal(0, 2, 20000).astype(np.float32),
+    'integers': rng.integers(-10**12, 10**12, 20000),
+    'full int64 range': np.array([-2**63, 2**63 - 1, 0, 5, -5] * 100, dtype=np.int64),
+    'uint64': rng.integers(0, 2**64 - 1, 5000, dtype=np.uint64),
+    'duplicates': rng.integers(0, 30, 20000),
+    'booleans': rng.integers(0, 2, 500).astype(bool),
+    'big integers': np.array([random.randint(-2**80, 2**80) for _ in range(2000)], dtype=object),
+    'with infinity': np.append(rng.uniform(0, 1, 1000), [np.inf, -np.inf, -0.0, 0.0]),
+    'equal': np.full(500, 7.5),
+    'single': np.array([1.0]),
+    'empty': np.array([], dtype=np.float64),
+}
+for name, keys in cases.items():
+    expected = np.argsort(keys, kind='stable')
+    for load, oversample, seed in ((64, 8, 0), (4, 2, 1), (16, 32, 2), (1000, 1, 3)):
+        perm = sample_argsort(keys, load, oversample, seed)
+        if perm.dtype != np.int64 or not np.array_equal(perm, expected):
+            print(f"✗ {name}, load {load}, oversample {oversample}: not the stable sorting permutation")
+            sys.exit(1)
+print("✓ Sample argsort is stable and exact for every load, oversampling and seed")
+
+# Quantile splitters balance the buckets on skewed keys, where equal-width buckets do not
+for name in ('uniform', 'heavy tail', 'start burst', 'negative floats', 'integers'):
+    keys = cases[name]
+    _, stats = sample_argsort(keys, return_stats=True)
+    if stats['n'] != len(keys) or stats['buckets'] != len(keys) // 64 or abs(stats['mean_load'] - len(keys) / stats['buckets']) > 1e-9:
+        print(f"✗ {name}: inconsistent balance statistics {stats}")
+        sys.exit(1)
+    if stats['imbalance'] > 8 or stats['empty'] > 0.1:
+        print(f"✗ {name}: unbalanced buckets {stats}")
+        sys.exit(1)
+_, stats = sample_argsort(cases['duplicates'], return_stats=True)
+if stats['max_load'] < len(cases['duplicates']) // 30 // 2:
+    print(f"✗ duplicates: equal keys were split across buckets {stats}")
+    sys.exit(1)
+print("✓ Bucket balance statistics are consistent and skewed keys stay balanced")
+
+random.seed(2724)
+for trial in range(200):
+    size = random.randint(0, 300)
+    if trial % 2:
+        jobs = [(random.expovariate(0.01), random.uniform(0, 100), k) for k in range(size)]
+    else:
+        jobs = [(random.randint(0, 20), random.randint(0, 20), k) for k in range(size)]
+    for key_index in (0, 1):
+        expected = sorted(jobs, key=lambda job: job[key_index])
+        if sample_sort(jobs, key_index, load=random.choice([2, 8, 64])) != expected:
+            print(f"✗ Trial {trial}: sample_sort by key {key_index} differs from a stable sort")
+            sys.exit(1)
+print("✓ sample_sort matches a stable sort of the jobs")
+
+for trial in range(30):
+    n = random.randint(1, 3000)
+    starts = np.random.default_rng(trial).exponential(1e3, n)
+    ends = starts + np.minimum(np.random.default_rng(trial + 1).zipf(2.0, n), 10**4)
+    weights = np.random.default_rng(trial + 2).integers(1, 101, n)
+    jobs = list(zip(starts.tolist(), ends.tolist(), weights.tolist()))
+    expected = classical_weighted_interval_scheduling(list(jobs))
+    if (gpi_weighted_job_scheduling(jobs, 'sample') != expected
+            or gpi_weighted_job_scheduling_columnar(starts, ends, weights, 'sample') != expected
+            or gpi_weighted_job_scheduling_columnar(starts, ends, weights, 'sample', single_sort=True) != expected):
+        print(f"✗ Trial {trial}: 'sample' solvers disagree with the classical DP")
+        sys.exit(1)
+print("✓ GPI solvers with sortAlgo='sample' match the classical DP")
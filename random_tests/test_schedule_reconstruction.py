@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import random
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from scheduling_algos import (classical_weighted_interval_scheduling, gpi_weighted_job_scheduling,
+                              gpi_weighted_job_scheduling_columnar)
+
+def random_jobs(n, max_val=50):
+    jobs = [(random.randint(0, max_val), random.randint(0, max_val), random.randint(1, 100)) for _ in range(n)]
+    return [(min(s, e), max(s, e) + (s == e), w) for s, e, w in jobs]
+
+def check_schedule(jobs, selected, optimum):
+    chosen = sorted((jobs[k] for k in selected), key=lambda job: job[1])
+    if sum(job[2] for job in chosen) != optimum:
+        return False
+    return all(a[1] <= b[0] for a, b in zip(chosen, chosen[1:]))
+
+random.seed(2724)
+algorithms = ['default', 'radix', 'bucket', 'recursive bucket', 'spread', 'integer spread']
+for trial in range(200):
+    jobs = random_jobs(random.randint(1, 100))
+    expected = classical_weighted_interval_scheduling(list(jobs))
+
+    results = {'classical': classical_weighted_interval_scheduling(jobs, return_jobs=True)}
+    for algo in algorithms:
+        results[algo] = gpi_weighted_job_scheduling(jobs, sortAlgo=algo, return_jobs=True)
+    optimum, selected = gpi_weighted_job_scheduling_columnar(np.array(jobs), return_jobs=True)
+    results['columnar'] = (optimum, selected.tolist())
+
+    for name, (optimum, selected) in results.items():
+        if optimum != expected or not check_schedule(jobs, selected, optimum):
+            print(f"✗ {name} returned an invalid schedule on trial {trial}: {optimum}, {selected}")
+            sys.exit(1)
+
+print("✓ All backends return a valid optimal schedule in original job indices")
+
+# Zero-length jobs (start == end) are compatible with every job ending at their time, so
+# ties in the end order must not lose them, and the schedule must add up to the optimum
+# check_schedule with zero-length jobs placed after the other jobs ending at their time
+def check_schedule_with_ties(jobs, selected, optimum):
+    return check_schedule(jobs, sorted(selected, key=lambda k: jobs[k][0]), optimum)
+
+def brute_force(jobs):
+    best = 0
+    for mask in range(1 << len(jobs)):
+        chosen = [k for k in range(len(jobs)) if mask >> k & 1]
+        weight = sum(jobs[k][2] for k in chosen)
+        if weight > best and check_schedule_with_ties(jobs, chosen, weight):
+            best = weight
+    return best
+
+if gpi_weighted_job_scheduling([(20.5, 20.5, 7), (2.5, 6.5, 2)], return_jobs=True) != (9, [1, 0]):
+    print("✗ A zero-length job after another job is not chained to it")
+    sys.exit(1)
+for trial in range(300):
+    jobs = []
+    for _ in range(random.randint(1, 8)):
+        start = random.randint(0, 8)
+        jobs.append((start, start + random.choice([0, 0, 1, 2, 3]), random.randint(1, 9)))
+    expected = brute_force(jobs)
+    results = {'classical': classical_weighted_interval_scheduling(list(jobs), return_jobs=True)}
+    for algo in algorithms:
+        results[algo] = gpi_weighted_job_scheduling(jobs, sortAlgo=algo, return_jobs=True)
+    for single_sort in (False, True):
+        optimum, selected = gpi_weighted_job_scheduling_columnar(np.array(jobs), return_jobs=True, single_sort=single_sort)
+        results[f'columnar, single_sort={single_sort}'] = (optimum, selected.tolist())
+    optimum, selected = gpi_weighted_job_scheduling(jobs, return_jobs=True, memory_lean=True)
+    results['lean'] = (optimum, selected.tolist())
+
+    for name, (optimum, selected) in results.items():
+        if optimum != expected or not check_schedule_with_ties(jobs, selected, optimum):
+            print(f"✗ {name} on zero-length jobs {jobs}: {optimum}, {selected}, expected {expected}")
+            sys.exit(1)
+
+print("✓ Zero-length jobs: every backend returns the brute-force optimum and a schedule achieving it")
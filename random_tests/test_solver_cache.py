@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import random
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from scheduling_algos import classical_weighted_interval_scheduling, gpi_weighted_job_scheduling
+from cache_algos import SolverCache, instance_key
+
+random.seed(2724)
+pool = []
+for _ in range(30):
+    fractional = random.random() < 0.4
+    jobs = []
+    for _ in range(random.randint(0, 40)):
+        start = random.uniform(0, 50) if fractional else random.randint(0, 50)
+        jobs.append((start, start + random.randint(1, 9), random.randint(1, 9)))
+    pool.append(jobs)
+
+cache = SolverCache(max_bytes=5000)
+cached_gpi = cache.wrap(gpi_weighted_job_scheduling)
+cached_classical = cache.wrap(classical_weighted_interval_scheduling)
+for trial in range(3000):
+    shift = random.choice([0, 0, 7, 1000, -3])
+    jobs = [(start + shift, end + shift, weight) for start, end, weight in random.choice(pool)]
+    expected = classical_weighted_interval_scheduling(list(jobs))
+    return_jobs = random.random() < 0.5
+    solver = random.choice([lambda jobs, **kw: cache.solve(np.array(jobs).reshape(-1, 3), **kw),
+                            cached_gpi, cached_classical])
+    result = solver(jobs, return_jobs=return_jobs)
+
+    optimum = result[0] if return_jobs else result
+    if optimum != expected:
+        print(f"✗ Trial {trial}: expected {expected}, got {optimum}")
+        sys.exit(1)
+    if return_jobs:
+        chosen = sorted((jobs[i] for i in list(result[1])), key=lambda job: job[1])
+        if sum(job[2] for job in chosen) != expected or any(a[1] > b[0] for a, b in zip(chosen, chosen[1:])):
+            print(f"✗ Trial {trial}: cached schedule is not optimal")
+            sys.exit(1)
+    if cache.nbytes > cache.max_bytes:
+        print(f"✗ Trial {trial}: cache holds {cache.nbytes} bytes, over its {cache.max_bytes} byte bound")
+        sys.exit(1)
+
+stats = cache.stats()
+if not (stats['hits'] and stats['misses'] and stats['evictions']) or stats['hits'] + stats['misses'] != 3000:
+    print(f"✗ Unexpected counters: {stats}")
+    sys.exit(1)
+
+# Results are not shared across solvers, backends or keyword arguments
+cache = SolverCache()
+cached_gpi = cache.wrap(gpi_weighted_job_scheduling)
+cached_classical = cache.wrap(classical_weighted_interval_scheduling)
+floats = [(0.5, 2.5, 1), (1.5, 3.5, 2)]
+cached_gpi(floats)
+try:
+    cached_gpi(floats, 'radix')
+except TypeError:
+    pass
+else:
+    print("✗ A cached 'default' result was served to sortAlgo='radix' on float times")
+    sys.exit(1)
+jobs = [(0, 2, 1), (2, 4, 2), (1, 3, 5)]
+for call in (lambda: cached_gpi(jobs, presorted='end'), lambda: cached_gpi(jobs, memory_lean=True),
+             lambda: cached_classical(jobs)):
+    before = cache.misses
+    if call() != classical_weighted_interval_scheduling(list(jobs)) or cache.misses != before + 1:
+        print("✗ Keyword arguments or the solver were not part of the cache key")
+        sys.exit(1)
+optimum, selected = cached_gpi(jobs, return_jobs=True, memory_lean=True)
+if optimum != 5 or selected != [2]:
+    print(f"✗ Keyword arguments were not passed to the wrapped solver: {optimum}, {selected}")
+    sys.exit(1)
+print("✓ Cache entries are keyed by solver, backend and keyword arguments")
+
+# Integer time shifts share a key; different weights or inexact float shifts do not
+if instance_key([(1, 3, 2), (3, 5, 2)]) != instance_key([(11, 13, 2), (13, 15, 2)]):
+    print("✗ Time-shifted instances hash differently")
+    sys.exit(1)
+if instance_key([(1, 3, 2)]) == instance_key([(1, 3, 3)]):
+    print("✗ Instances with different weights share a key")
+    sys.exit(1)
+
+print(f"✓ Solver cache returns correct results ({stats['hits']} hits, {stats['misses']} misses, "
+      f"{stats['evictions']} evictions)")
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import random
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import boost_spreadsort
+from scheduling_algos import classical_weighted_interval_scheduling, gpi_weighted_job_scheduling_columnar
+
+random.seed(2724)
+np.random.seed(2724)
+
+# Sorting NumPy input returns NumPy arrays that own the C++ buffer
+vals = np.random.uniform(0, 1e9, 1000)
+sorted_vals = boost_spreadsort.float_sort_doubles(vals)
+assert isinstance(sorted_vals, np.ndarray) and np.array_equal(sorted_vals, np.sort(vals))
+assert isinstance(boost_spreadsort.float_sort_doubles(vals.tolist()), list)
+
+jobs_array = np.column_stack((vals, vals + np.random.uniform(1, 1e6, 1000), np.random.uniform(1, 100, 1000)))
+by_end = boost_spreadsort.float_sort_tuples_by_key(jobs_array, 1)
+assert by_end.shape == (1000, 3) and np.all(np.diff(by_end[:, 1]) >= 0)
+print("✓ NumPy sort overloads return sorted NumPy arrays")
+
+for trial in range(200):
+    n = random.randint(1, 100)
+    jobs = [(random.randint(0, 50), random.randint(0, 50), random.randint(1, 100)) for _ in range(n)]
+    jobs = [(min(s, e), max(s, e) + (s == e), w) for s, e, w in jobs]
+    expected = classical_weighted_interval_scheduling(list(jobs))
+    arr = np.array(jobs)
+
+    answers = [
+        boost_spreadsort.gpi_solve(jobs),
+        boost_spreadsort.gpi_solve(arr),
+        boost_spreadsort.gpi_solve(arr[:, 0], arr[:, 1], arr[:, 2]),
+        gpi_weighted_job_scheduling_columnar(arr, sortAlgo='spread'),
+    ]
+    if any(answer != expected for answer in answers):
+        print(f"✗ Mismatch on trial {trial}: expected {expected}, got {answers}")
+        sys.exit(1)
+
+    optimum, selected = boost_spreadsort.gpi_solve(arr, return_jobs=True)
+    if not isinstance(selected, np.ndarray) or arr[selected, 2].sum() != optimum:
+        print(f"✗ Invalid selection on trial {trial}: {selected}")
+        sys.exit(1)
+
+print("✓ gpi_solve agrees across list, (n, 3) and column inputs")
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from scheduling_algos import classical_weighted_interval_scheduling
+from streaming_algos import gpi_stream_bounded_duration
+
+random.seed(2724)
+for trial in range(200):
+    max_duration = random.randint(1, 50)
+    jobs = []
+    span = random.choice([100, 2000])
+    for _ in range(random.randint(0, 500)):
+        start = random.randint(0, span)
+        jobs.append((start, start + random.randint(0, max_duration), random.randint(1, 100)))
+    jobs.sort(key=lambda job: job[1])  # equal ends, zero-length ones included, stay in random order
+
+    expected = classical_weighted_interval_scheduling(list(jobs))
+    optimum, peak = gpi_stream_bounded_duration(iter(jobs), max_duration, return_peak=True)
+    if optimum != expected:
+        print(f"✗ Trial {trial}: expected {expected}, got {optimum}")
+        sys.exit(1)
+    if jobs and peak > len(jobs):
+        print(f"✗ Trial {trial}: buffer peak {peak} exceeds n={len(jobs)}")
+        sys.exit(1)
+
+if gpi_stream_bounded_duration([(5, 5, 1), (1, 5, 10)], 10) != 11:
+    print("✗ A zero-length job before a longer job with the same end was not chained after it")
+    sys.exit(1)
+
+print("✓ Bounded-duration stream matches the classical DP")
@@ -1,19 +1,111 @@
 import time
 import gc
+import os
+import sys
+import pickle
+import resource
+import subprocess
+import tracemalloc
 import numpy as np
 import matplotlib.pyplot as plt
 import random
+import scheduling_algos
 from scheduling_algos import classical_weighted_interval_scheduling, gpi_weighted_job_scheduling
 from plotting import make_plots
 
 
-def run_experiment(exp_title, gpi_linear_sort, gpi_linear_sort_label, job_generator, trials=10, n_start=1000, n_end=100000, n_step=1000):
+# Peak RSS of this process in bytes. On Linux this is VmHWM, since ru_maxrss keeps the
+# parent's peak across fork and exec; elsewhere ru_maxrss (in bytes on macOS)
+def max_rss_bytes():
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == 'darwin' else rss * 1024
+
+# Runs in a fresh interpreter started by measure_memory, which sends (solver name in
+# scheduling_algos, sortAlgo, jobs) on stdin. Writes back on stdout:
+#   peak_rss     growth of the process's peak RSS over its starting RSS during one solve
+#   peak_traced  peak bytes traced by tracemalloc during a second solve
+#   peak_blocks  peak number of live allocated blocks (sys.getallocatedblocks) above the
+#                starting count, sampled at every function return during that solve
+#   phases       {phase: (peak_traced, peak_blocks)} for each phase of the traced solve
+#                ('sort', 'predecessors', 'dp' or 'native', from scheduling_algos.phase_hook):
+#                tracemalloc's peak and the block peak restart at every phase boundary,
+#                and both count what is live since the solve started
+def _measure_in_child():
+    solver_name, sortAlgo, jobs = pickle.load(sys.stdin.buffer)
+    solve = getattr(scheduling_algos, solver_name)
+
+    unsorted = list(jobs)  # each solve gets unsorted jobs (the classical solver sorts in place)
+    baseline_rss = max_rss_bytes()
+    solve(unsorted, sortAlgo)
+    peak_rss = max_rss_bytes() - baseline_rss
+
+    unsorted = list(jobs)
+    gc.collect()
+    base_blocks = peak_blocks = phase_blocks = sys.getallocatedblocks()
+    peak_traced = 0
+    phases = {}
+    current = None
+
+    def sample(frame, event, arg):
+        nonlocal peak_blocks, phase_blocks
+        if event == 'return' or event == 'c_return':
+            blocks = sys.getallocatedblocks()
+            peak_blocks = max(peak_blocks, blocks)
+            phase_blocks = max(phase_blocks, blocks)
+
+    def end_phase():
+        nonlocal peak_traced
+        traced = tracemalloc.get_traced_memory()[1]
+        peak_traced = max(peak_traced, traced)
+        if current is not None:
+            phases[current] = (traced, phase_blocks - base_blocks)
+
+    def start_phase(name):
+        nonlocal current, phase_blocks
+        end_phase()
+        tracemalloc.reset_peak()
+        current, phase_blocks = name, sys.getallocatedblocks()
+
+    scheduling_algos.phase_hook = start_phase
+    tracemalloc.start()
+    sys.setprofile(sample)
+    solve(unsorted, sortAlgo)
+    sys.setprofile(None)
+    end_phase()
+    tracemalloc.stop()
+    scheduling_algos.phase_hook = None
+    pickle.dump((peak_traced, peak_blocks - base_blocks, peak_rss, phases), sys.stdout.buffer)
+
+# Memory profile of solver(jobs, sortAlgo) as (peak_traced, peak_blocks, peak_rss, phases)
+# (see _measure_in_child). It runs in a fresh interpreter (subprocess, not fork), so
+# earlier runs in this process cannot hide its peak, tracing does not slow down the timed
+# runs, and it is safe on every platform.
+def measure_memory(solver, sortAlgo, jobs):
+    child = subprocess.run([sys.executable, os.path.abspath(__file__)], check=True, stdout=subprocess.PIPE,
+                           input=pickle.dumps((solver.__name__, sortAlgo, jobs)))
+    return pickle.loads(child.stdout)
+
+
+def run_experiment(exp_title, gpi_linear_sort, gpi_linear_sort_label, job_generator, trials=10, n_start=1000, n_end=100000, n_step=1000, measure_memory_usage=False):
     RANDOM_SEED = 2724
     random.seed(RANDOM_SEED)
     np.random.seed(RANDOM_SEED)
     results_classic = []
     results_gpi_linear = []
     results_gpi_tim = []
+    memory_results = {'classic': [], 'gpi_tim': [], 'gpi_linear': []}  # (n, peak_traced, peak_blocks, peak_rss, phases)
+    solvers = {
+        'classic': (classical_weighted_interval_scheduling, "default"),
+        'gpi_tim': (gpi_weighted_job_scheduling, "default"),
+        'gpi_linear': (gpi_weighted_job_scheduling, gpi_linear_sort),
+    }
 
     for n in range(n_start, n_end+1, n_step):
         total_classic = 0
@@ -23,24 +115,29 @@ def run_experiment(exp_title, gpi_linear_sort, gpi_linear_sort_label, job_genera
         MAX_VAL = 10**6
         for _ in range(trials):
             jobs = job_generator(n)
+            # Each solver gets its own unsorted copy: the classical solver sorts its input in
+            # place, and the solvers skip sorts on presorted input
             # Classic
+            unsorted = list(jobs)
             gc.enable(); gc.collect(); gc.disable()
             start = time.perf_counter()
-            classicAnswer = classical_weighted_interval_scheduling(jobs, sortAlgo="default") # as opposed to "default"
+            classicAnswer = classical_weighted_interval_scheduling(unsorted, sortAlgo="default") # as opposed to "default"
             end = time.perf_counter()
             total_classic += (end - start)
 
             # GPI Timsort
+            unsorted = list(jobs)
             gc.enable(); gc.collect(); gc.disable()
             start = time.perf_counter()
-            gpiTimAnswer = gpi_weighted_job_scheduling(jobs, sortAlgo="default")
+            gpiTimAnswer = gpi_weighted_job_scheduling(unsorted, sortAlgo="default")
             end = time.perf_counter()
             total_gpi_tim += (end - start)
 
             # GPI Linear Sort
+            unsorted = list(jobs)
             gc.enable(); gc.collect(); gc.disable()
             start = time.perf_counter()
-            gpiLinearAnswer = gpi_weighted_job_scheduling(jobs, sortAlgo=gpi_linear_sort)
+            gpiLinearAnswer = gpi_weighted_job_scheduling(unsorted, sortAlgo=gpi_linear_sort)
             end = time.perf_counter()
             total_gpi_linear += (end - start)
 
@@ -55,4 +152,19 @@ def run_experiment(exp_title, gpi_linear_sort, gpi_linear_sort_label, job_genera
         results_gpi_tim.append((n, avg_gpi_tim))
         results_gpi_linear.append((n, avg_gpi_linear))
         print(f"n = {n}, classic = {avg_classic:.6f} s, gpi_tim = {avg_gpi_tim:.6f} s, gpi_linear={avg_gpi_linear:.6f} s")
-    make_plots(exp_title, gpi_linear_sort_label, results_classic, results_gpi_tim, results_gpi_linear)
+
+        # Memory, once per algorithm on the last trial's jobs, outside the timed runs
+        if measure_memory_usage:
+            for name, (solver, sortAlgo) in solvers.items():
+                memory_results[name].append((n,) + measure_memory(solver, sortAlgo, jobs))
+            for name, results in memory_results.items():
+                _, traced, blocks, rss, phases = results[-1]
+                print(f"    memory {name}: traced={traced / 2**20:.1f} MiB blocks={blocks} rss={rss / 2**20:.1f} MiB; " +
+                      ", ".join(f"{phase} {phase_traced / 2**20:.1f} MiB/{phase_blocks} blocks"
+                                for phase, (phase_traced, phase_blocks) in phases.items()))
+    make_plots(exp_title, gpi_linear_sort_label, results_classic, results_gpi_tim, results_gpi_linear,
+               memory_results if measure_memory_usage else None)
+
+
+if __name__ == '__main__':
+    _measure_in_child()
@@ -17,8 +17,25 @@
 # Email 2: amit.joshiusa@gmail.com
 # GitHub: https://github.com/amitjoshi2724
 
-import boost_spreadsort
 import numpy as np
+from array import array
+from operator import itemgetter
+
+try:
+    import boost_spreadsort
+except ImportError:
+    # The compiled extension is optional: 'spread' and 'integer spread' then run on the
+    # vectorized NumPy radix sorts below
+    boost_spreadsort = None
+
+# Memory profiling hook (see running.measure_memory): when set, it is called with 'sort',
+# 'predecessors' or 'dp' as each phase of the list solvers starts, and with 'native' before
+# a fused native kernel call. The classical solver's binary searches run inside its 'dp'.
+phase_hook = None
+
+def _phase(name):
+    if phase_hook is not None:
+        phase_hook(name)
 
 # bisect_right, a binary search
 def find_pred(jobs, start_i, cur_index = None):
@@ -34,60 +51,177 @@ def find_pred(jobs, start_i, cur_index = None):
     return lo - 1  # correctly gives index of latest non-overlapping job
 
 # O(n log(n)) DP solution for WIS, our baseline to improve upon
-def classical_weighted_interval_scheduling(jobs, sortAlgo='default'):
-    if sortAlgo == 'radix':
-        jobs = radix_sort(jobs, key_index=1) # sort by end time with radix sort
+# presorted='end' skips the sort for callers that guarantee end-time order
+def classical_weighted_interval_scheduling(jobs, sortAlgo='default', return_jobs=False, presorted=None):
+    _check_presorted(presorted)
+    _phase('sort')
+    if return_jobs:
+        jobs = [(t[0], t[1], t[2], k) for k, t in enumerate(jobs)]  # tag each job with its original index
+    if presorted == 'end':
+        pass
+    elif sortAlgo == 'radix':
+        jobs = _sort_presorted(jobs, 1, radix_sort) # sort by end time with radix sort
     else:
-        jobs.sort(key=lambda x: x[1])  # sort by end time with comparison-based sorting
+        jobs.sort(key=lambda x: x[1])  # sort by end time with comparison-based sorting (Timsort adapts to presorted input)
+    jobs = _zero_length_last(jobs)
+    _phase('dp')
     n = len(jobs)
     dp = [0] * (n + 1)
 
     for i in range(1, n + 1):
-        start_i, end_i, weight_i = jobs[i - 1]
-        pred_idx = find_pred(jobs, start_i, i)
-        include = weight_i + dp[pred_idx + 1] #dp[0] = 0
+        job = jobs[i - 1]  # (start, end, weight), plus the original index when return_jobs
+        pred_idx = find_pred(jobs, job[0], i - 1)  # among the jobs before i (see _cap_predecessors)
+        include = job[2] + dp[pred_idx + 1] #dp[0] = 0
         dp[i] = max(dp[i - 1], include)
 
+    if return_jobs:
+        # predecessors are not stored here, so redo the binary search for the selected jobs only
+        selected = _traceback(dp, lambda i: find_pred(jobs, jobs[i - 1][0], i - 1) + 1)
+        return dp[n], [jobs[i - 1][3] for i in selected]
     return dp[n]
 
+# Ties in the end order: a zero-length job (end <= start) is compatible with every job
+# ending at its time, and the DP only chains a job after the jobs before it in end
+# order, so zero-length jobs go after the other jobs with the same end. Takes a list of
+# jobs sorted by end time; only equal-end groups move, and only if such a job exists.
+def _zero_length_last(jobs):
+    if not any(job[0] >= job[1] for job in jobs):
+        return jobs
+    return sorted(jobs, key=lambda job: (job[1], job[0] >= job[1]))
+
+# _zero_length_last for columns: the reordering of end-ordered starts and ends that
+# moves zero-length jobs behind the rest of their equal-end group, or None if no job moves
+def _zero_length_tie_order(starts, ends):
+    zero_length = starts >= ends
+    if not zero_length.any():
+        return None
+    group = np.concatenate(([0], np.cumsum(ends[1:] != ends[:-1])))
+    return np.argsort(2 * group + zero_length, kind='stable')
+
+def _zero_length_last_perm(end_perm, starts, ends):
+    tie_order = _zero_length_tie_order(starts[end_perm], ends[end_perm])
+    return end_perm if tie_order is None else end_perm[tie_order]
+
+# O(n) traceback of an optimal schedule from dp and the 1-indexed predecessor
+# function pred, the same one the DP read (pred(i) < i, see _cap_predecessors).
+# Job i is selected exactly when dp[i] > dp[i - 1], so the choice bits are read off
+# dp itself and only the selected positions are stored (as a compact int64 array).
+# Returns the 1-indexed end-order positions, ascending.
+def _traceback(dp, pred):
+    selected = array('q')
+    i = len(dp) - 1
+    while i > 0:
+        if dp[i] != dp[i - 1]:
+            selected.append(i)
+            i = pred(i)
+        else:
+            i -= 1
+    selected.reverse()
+    return selected
+
+# Integer key check for the radix sorts; an empty list of jobs gives float64 keys
+def _check_integer_keys(keys):
+    if keys.dtype.kind not in 'iub' and len(keys):
+        raise TypeError("radix sort requires integer keys")
+    return keys
+
 # Radix sort helper: sorts list of tuples by key_index
 def radix_sort(jobs, key_index):
-    max_val = max(job[key_index] for job in jobs)
-    exp = 1
-    base = 10
-    while max_val // exp > 0:
-        count = [[] for _ in range(base)]
-        for job in jobs:
-            digit = (job[key_index] // exp) % base
-            count[digit].append(job)
-        jobs = [job for bucket in count for job in bucket]
-        exp *= base
-    return jobs
-
-def bucket_sort(jobs, key_index):
-    n = len(jobs)
-    if n == 0:
-        return []
+    keys = np.array([job[key_index] for job in jobs])
+    perm = radix_argsort(keys)
+    return [jobs[i] for i in perm.tolist()]
 
-    min_val = min(job[key_index] for job in jobs)
-    max_val = max(job[key_index] for job in jobs)
-    if max_val == min_val:
-        return jobs.copy()
+RADIX_DIGIT_BITS = (8, 11, 16)
 
-    # Create n buckets
-    buckets = [[] for _ in range(n)]
-    scale = (n - 1) / (max_val - min_val + 1e-9)  # avoid div by 0
+# Digit width minimizing passes * (n + 2^bits): wide digits mean fewer passes,
+# but each pass also pays for a 2^bits-entry histogram
+def _radix_digit_bits(n, key_bits):
+    return min(RADIX_DIGIT_BITS, key=lambda bits: (-(-key_bits // bits)) * (n + (1 << bits)))
 
-    # Assign jobs to buckets
-    for job in jobs:
-        idx = int((job[key_index] - min_val) * scale)
-        buckets[idx].append(job)
+# Vectorized LSD radix sort over integer keys; returns a stable int64 permutation.
+# Keys are shifted to a zero origin, so the number of passes depends on the key range
+# rather than the magnitude (epoch timestamps cost the same as small integers).
+# Each pass is a counting sort (histogram, prefix sum, stable scatter) on one digit,
+# done by NumPy's stable sort, which is itself a counting sort for 8/16-bit keys.
+def radix_argsort(keys):
+    keys = _check_integer_keys(np.asarray(keys))
+    if keys.dtype.kind == 'b':
+        keys = keys.view(np.uint8)  # NumPy has no boolean subtraction
+    n = len(keys)
+    perm = np.arange(n, dtype=np.int64)
+    if n <= 1:
+        return perm
 
-    # Sort each bucket and concatenate
-    sorted_jobs = []
-    for bucket in buckets:
-        sorted_jobs.extend(sorted(bucket, key=lambda job: job[key_index]))
-    return sorted_jobs
+    min_key = keys.min()
+    key_range = int(keys.max()) - int(min_key)
+    if key_range == 0:
+        return perm
+    remaining = (keys - min_key).astype(np.uint64)  # order-preserving shift to [0, key_range]
+    key_bits = key_range.bit_length()
+    digit_bits = _radix_digit_bits(n, key_bits)
+    digit_dtype = np.uint8 if digit_bits <= 8 else np.uint16
+    mask = np.uint64((1 << digit_bits) - 1)
+
+    shifts = range(0, key_bits, digit_bits)
+    for shift in shifts:
+        digits = ((remaining >> np.uint64(shift)) & mask).astype(digit_dtype)
+        order = np.argsort(digits, kind='stable')
+        perm = perm[order]
+        if shift != shifts[-1]:
+            remaining = remaining[order]
+    return perm
+
+# Order-preserving map of IEEE-754 floats to unsigned ints of the same width: negative
+# floats get every bit flipped (larger magnitudes sort first), non-negative ones only the
+# sign bit set, so the unsigned order of the images is the float order. -0.0 is folded
+# into +0.0 first, since the two compare equal.
+def _float_radix_keys(keys):
+    uint = np.dtype(f'u{keys.dtype.itemsize}')
+    bits = (keys + keys.dtype.type(0)).view(uint)
+    sign = uint.type(1 << (8 * uint.itemsize - 1))
+    return np.where(bits & sign, ~bits, bits | sign)
+
+# Vectorized LSD radix argsort of float keys through their IEEE-754 bit patterns (stable),
+# the NumPy fallback for 'spread' when boost_spreadsort is not built. Integer keys go to
+# radix_argsort directly, and floats without a matching unsigned width (longdouble) to
+# NumPy's stable sort.
+def float_radix_argsort(keys):
+    keys = np.asarray(keys)
+    if keys.dtype.kind in 'iub':
+        return radix_argsort(keys)
+    if keys.dtype.kind != 'f' or keys.dtype.itemsize not in (2, 4, 8):
+        return np.argsort(keys, kind='stable').astype(np.int64, copy=False)
+    return radix_argsort(_float_radix_keys(keys))
+
+# Average keys per bucket of the bucket sorts
+BUCKET_LOAD_FACTOR = 1.0
+
+# Counting-based bucket argsort (stable): a vectorized bucket id per key over
+# ceil(n / load_factor) equal-width buckets, a counting sort of the ids (histogram,
+# prefix sum and scatter into one flat index array, done by radix_argsort), then one
+# stable sort of the keys in bucket order to finish the buckets. That pass only fixes
+# inversions inside buckets, which Timsort does in about O(n) when buckets are small,
+# so uniform keys sort in O(n) with no per-bucket allocation.
+def bucket_argsort(keys, load_factor=BUCKET_LOAD_FACTOR):
+    keys = np.asarray(keys)
+    n = len(keys)
+    if n <= 1:
+        return np.arange(n, dtype=np.int64)
+    values = keys.astype(np.float64, copy=False)  # order-preserving, so bucket ids ascend with keys
+    low = values.min()
+    span = values.max() - low
+    if not np.isfinite(span) or span <= 0:  # all keys equal, or infinite / NaN keys
+        return np.argsort(keys, kind='stable').astype(np.int64, copy=False)
+    buckets = max(1, int(np.ceil(n / load_factor)))
+    ids = ((values - low) / span * buckets).astype(np.int64)
+    np.minimum(ids, buckets - 1, out=ids)
+    perm = radix_argsort(ids)
+    return perm[np.argsort(keys[perm], kind='stable')]
+
+def bucket_sort(jobs, key_index, load_factor=BUCKET_LOAD_FACTOR):
+    keys = np.array([job[key_index] for job in jobs])
+    perm = bucket_argsort(keys, load_factor)
+    return [jobs[i] for i in perm.tolist()]
 
 def recursive_adaptive_bucket_sort(jobs, key_index, depth=0, max_depth=10, min_bucket_size=16):
     if len(jobs) <= min_bucket_size or depth >= max_depth:
@@ -111,30 +245,316 @@ def recursive_adaptive_bucket_sort(jobs, key_index, depth=0, max_depth=10, min_b
         sorted_jobs.extend(recursive_adaptive_bucket_sort(bucket, key_index, depth + 1, max_depth, min_bucket_size))
     return sorted_jobs
 
+# Samplesort: average keys per bucket, sampled keys per bucket (splitter accuracy), and
+# lookup cells per bucket (resolution of the key -> bucket table, at most 2^20 cells)
+SAMPLE_SORT_LOAD = 64
+SAMPLE_SORT_OVERSAMPLE = 8
+SAMPLE_SORT_CELLS = 8
+SAMPLE_SORT_MAX_CELLS = 1 << 20
+
+# Monotone map of integer or float keys to uint64 codes: the IEEE-754 bits of each key's
+# float64 distance from the smallest key. Bits of non-negative floats order like the
+# floats and are close to logarithmic in them, so heavy tails stay resolved, and the
+# distances keep keys on both sides of zero from spanning every exponent in between.
+def _sample_sort_codes(keys):
+    if keys.dtype.kind in 'iu':
+        distances = (keys - keys.min()).astype(np.uint64).astype(np.float64)
+    else:
+        values = keys.astype(np.float64, copy=False)
+        with np.errstate(invalid='ignore'):  # inf - inf: the NaN code only costs balance
+            distances = values - values.min()
+    return distances.view(np.uint64)
+
+# Bucket loads of a samplesort as returned with return_stats=True
+def _bucket_balance(ids, buckets, sample):
+    counts = np.bincount(ids, minlength=buckets)
+    mean = len(ids) / buckets
+    return {'n': len(ids), 'buckets': buckets, 'sample': sample, 'max_load': int(counts.max()),
+            'mean_load': mean, 'imbalance': counts.max() / mean,
+            'empty': int(np.count_nonzero(counts == 0)) / buckets}
+
+# Samplesort argsort (stable), for keys whose distribution is unknown or skewed. Bucket
+# boundaries are the quantiles of a random sample of oversample keys per bucket, so every
+# bucket expects about `load` keys whatever the distribution. Keys are assigned in one
+# vectorized pass: each key's code (_sample_sort_codes) is cut to a fine cell and a
+# lookup table maps cells to buckets, with no per-key binary search. Then, as in
+# bucket_argsort, a counting sort of the bucket ids and one stable Timsort pass that
+# finishes the buckets; there is no recursion, however crowded the key range. With
+# return_stats=True also returns the bucket balance: n, buckets, sample, max_load,
+# mean_load, imbalance (max_load / mean_load) and the fraction of empty buckets.
+# Runs of equal keys share a bucket, so they show up in max_load but cost nothing to finish.
+def sample_argsort(keys, load=SAMPLE_SORT_LOAD, oversample=SAMPLE_SORT_OVERSAMPLE, seed=0, return_stats=False):
+    keys = np.asarray(keys)
+    n = len(keys)
+    buckets = max(1, n // load)
+    if buckets == 1 or keys.dtype.kind not in 'iuf':
+        perm = np.argsort(keys, kind='stable').astype(np.int64, copy=False)
+        return (perm, _bucket_balance(np.zeros(n, dtype=np.int64), 1, 0)) if return_stats else perm
+
+    codes = _sample_sort_codes(keys)
+    sample = min(n, buckets * oversample)
+    sampled = np.sort(codes[np.random.default_rng(seed).integers(0, n, sample)])
+
+    # Cells split the sampled code range evenly, from the smallest nonzero code: 0 (the
+    # smallest key) lies every exponent below the rest. Codes outside go to the end cells.
+    nonzero = sampled[sampled > 0]
+    low = nonzero[0] if len(nonzero) else sampled[0]
+    span = int(sampled[-1]) - int(low)
+    cells = min(SAMPLE_SORT_MAX_CELLS, buckets * SAMPLE_SORT_CELLS)
+    shift = np.uint64(max(0, span.bit_length() - cells.bit_length()))
+    cell_ids = ((np.clip(codes, low, sampled[-1]) - low) >> shift).astype(np.int64)
+    sampled_cells = ((np.maximum(sampled, low) - low) >> shift).astype(np.int64)
+
+    splitters = sampled_cells[sample // buckets::sample // buckets][:buckets - 1]
+    table = np.searchsorted(splitters, np.arange((span >> int(shift)) + 1), side='right')
+    ids = table[cell_ids]
+
+    perm = radix_argsort(ids)
+    perm = perm[np.argsort(keys[perm], kind='stable')]
+    return (perm, _bucket_balance(ids, buckets, sample)) if return_stats else perm
+
+def sample_sort(jobs, key_index, load=SAMPLE_SORT_LOAD):
+    keys = np.array([job[key_index] for job in jobs])
+    perm = sample_argsort(keys, load)
+    return [jobs[i] for i in perm.tolist()]
+
+def timsort_by_key(jobs, key_index):
+    return sorted(jobs, key=itemgetter(key_index))
+
+# Sort backends for the tuple-list paths, all called as sort(jobs, key_index)
+LIST_SORTS = {
+    'radix': radix_sort,
+    'bucket': bucket_sort,
+    'recursive bucket': recursive_adaptive_bucket_sort,
+    'sample': sample_sort,
+}
+
+def _list_sort(sortAlgo):
+    return LIST_SORTS.get(sortAlgo, timsort_by_key)
+
+# Ascending runs up to which presorted input is merged instead of fully sorted
+PRESORTED_MAX_RUNS = 32
+
+def _check_presorted(presorted):
+    if presorted not in (None, 'end'):
+        raise ValueError("presorted must be None or 'end'")
+
+# Estimated displacement (a fraction of n) up to which keys count as nearly sorted;
+# beyond about this point a sort from scratch beats Timsort's run merging
+NEAR_SORTED_MAX_DISPLACEMENT = 1 / 256
+NEAR_SORTED_SAMPLE = 1 << 16
+
+# O(n) presortedness probe of a key array: 'sorted' (non-decreasing), 'reversed'
+# (non-increasing), 'runs' (fewer than PRESORTED_MAX_RUNS non-decreasing runs), 'near'
+# (every key close to its sorted position) or None
+def _presortedness(keys):
+    descents = np.count_nonzero(keys[1:] < keys[:-1]) if len(keys) > 1 else 0
+    if descents == 0:
+        return 'sorted'
+    if descents < PRESORTED_MAX_RUNS:
+        return 'runs'
+    if np.count_nonzero(keys[1:] > keys[:-1]) == 0:
+        return 'reversed'
+    if _displacement(keys) <= NEAR_SORTED_MAX_DISPLACEMENT:
+        return 'near'
+    return None
+
+# Estimated displacement of keys as a fraction of n: the largest drop of a key below
+# the running maximum before it, over the key span. With evenly spread keys that is the
+# share of keys it has to move past. Read off a strided sample of about
+# NEAR_SORTED_SAMPLE keys, so the estimate costs far less than the sort it decides on.
+def _displacement(keys):
+    sample = np.asarray(keys[::max(1, len(keys) // NEAR_SORTED_SAMPLE)], dtype=np.float64)
+    span = sample.max() - sample.min()
+    if not np.isfinite(span) or span <= 0:
+        return 1.0
+    return float((np.maximum.accumulate(sample) - sample).max() / span)
+
+# Sort jobs by key_index with sort_by_key behind the presortedness probe: sorted input
+# is returned as is, and reversed, few-run or nearly sorted input goes to Timsort, which
+# reverses descending runs and merges ascending ones in about O(n). Timsort does all of
+# this itself, so it is called directly. Radix sort key types are checked before the
+# probe, so the shortcut accepts exactly the inputs the full sort does.
+def _sort_presorted(jobs, key_index, sort_by_key):
+    if sort_by_key is timsort_by_key:
+        return sort_by_key(jobs, key_index)
+    keys = np.array(list(map(itemgetter(key_index), jobs)))
+    if sort_by_key is radix_sort:
+        _check_integer_keys(keys)
+    order = _presortedness(keys)
+    if order == 'sorted':
+        return jobs
+    if order is not None:
+        return timsort_by_key(jobs, key_index)
+    return sort_by_key(jobs, key_index)
+
+# sortAlgo='auto': the backend is picked per input from an O(sample) profile of the keys
+AUTO_SAMPLE_SIZE = 1024
+# Fraction of sampled pairs in order above which keys count as presorted, where the
+# run-adaptive stable sort (Timsort, NumPy's stable argsort) is close to O(n)
+AUTO_PRESORTED = 0.95
+# The vectorized radix sort beats the native integer_sort from this size on, when the
+# key range fits in two 16-bit digits
+AUTO_RADIX_MIN_SIZE = 1 << 16
+AUTO_RADIX_MAX_BITS = 32
+# The counting bucket sort beats float_sort from AUTO_RADIX_MIN_SIZE keys on, as long as
+# no sampled bucket is crowded (uniform, normal and exponential keys, not heavy tails)
+AUTO_BUCKET_MAX_LOAD = 32
+# Crowded float keys go to the samplesort from this size on, where its balanced buckets
+# beat float_sort
+AUTO_SAMPLE_MIN_SIZE = 1 << 20
+
+# (sortAlgo, stats) of the latest 'auto' resolution, for logging
+last_auto_sort = None
+
+def _record_auto_sort(sortAlgo, stats):
+    global last_auto_sort
+    last_auto_sort = (sortAlgo, stats)
+    return sortAlgo
+
+# O(sample) profile of one key column: keys is a 1-D array, or with key_index a sequence
+# of jobs. Only min(n, sample_size) evenly spaced positions and their right neighbours
+# are read. Returns a dict with
+#   n, sample        input size and number of sampled keys
+#   integer          every key is an integer (exact for arrays, from the sample for lists)
+#   min, max         sampled key range; key_bits is its bit length for integer keys
+#   occupancy        fraction of `sample` equal-width buckets over [min, max] hit by the
+#                    sample (about 0.63 for uniform keys, far lower for clustered keys)
+#   max_load         most sampled keys in one bucket (a handful for uniform keys)
+#   sorted_fraction  fraction of sampled adjacent pairs already in order
+#   trend            fraction of consecutive sample points in order (global presortedness)
+def profile_sort_keys(keys, key_index=None, sample_size=AUTO_SAMPLE_SIZE):
+    n = len(keys)
+    positions = np.unique(np.linspace(0, n - 1, min(n, sample_size)).astype(np.int64))
+    neighbours = positions[positions < n - 1] + 1
+    if key_index is None and isinstance(keys, np.ndarray):
+        integer = keys.dtype.kind in 'iub'
+        sample, after = keys[positions], keys[neighbours]
+        low, high = (sample.min().item(), sample.max().item()) if n else (None, None)
+    else:
+        get = keys.__getitem__ if key_index is None else (lambda i: keys[i][key_index])
+        sample = [get(i) for i in positions.tolist()]
+        after = [get(i) for i in neighbours.tolist()]
+        integer = all(isinstance(key, (int, np.integer)) for key in sample)
+        low, high = (min(sample), max(sample)) if n else (None, None)
+        # Python ints of any size become float64, which is enough for a profile
+        sample, after = np.array(sample, dtype=np.float64), np.array(after, dtype=np.float64)
+
+    stats = {'n': n, 'sample': len(sample), 'integer': integer, 'min': low, 'max': high,
+             'key_bits': (int(high) - int(low)).bit_length() if integer and n else 0,
+             'occupancy': 1.0, 'max_load': len(sample), 'sorted_fraction': 1.0, 'trend': 1.0}
+    m = len(sample)
+    if m > 1:
+        values = sample.astype(np.float64)
+        span = float(values.max() - values.min())
+        if np.isfinite(span) and span > 0:
+            buckets = np.minimum(((values - values.min()) * (m / span)).astype(np.int64), m - 1)
+            counts = np.bincount(buckets, minlength=m)
+            stats['occupancy'] = int(np.count_nonzero(counts)) / m
+            stats['max_load'] = int(counts.max())
+        else:
+            stats['occupancy'] = 1 / m
+        stats['trend'] = float(np.mean(sample[:-1] <= sample[1:]))
+    if len(after):
+        stats['sorted_fraction'] = float(np.mean(sample[:len(after)] <= after))
+    return stats
+
+def _presorted(stats):
+    return max(stats['sorted_fraction'], stats['trend']) >= AUTO_PRESORTED
+
+# Backend for _argsort(keys, 'auto') from the profile of keys. Presorted keys go to the
+# stable NumPy sort (run merging), integer keys to radix when the range is narrow and n
+# large, else to the native integer_sort, and float keys to the bucket sort when n is
+# large and the sampled bucket loads are low, to the samplesort when n is very large and
+# the loads are high (heavy tails, bursts), else to the native float_sort.
+# uint64 keys can exceed int64, so they take the radix sort, which handles the full range.
+def choose_argsort_algo(keys, sample_size=AUTO_SAMPLE_SIZE):
+    keys = np.asarray(keys)
+    stats = profile_sort_keys(keys, sample_size=sample_size)
+    if stats['n'] <= 1 or _presorted(stats) or keys.dtype.kind not in 'iubf':
+        sortAlgo = 'default'
+    elif not stats['integer']:
+        crowded = stats['max_load'] > AUTO_BUCKET_MAX_LOAD
+        if stats['n'] >= AUTO_RADIX_MIN_SIZE and not crowded:
+            sortAlgo = 'bucket'
+        elif stats['n'] >= AUTO_SAMPLE_MIN_SIZE:
+            sortAlgo = 'sample'
+        else:
+            sortAlgo = 'spread'
+    elif keys.dtype == np.uint64 or (stats['n'] >= AUTO_RADIX_MIN_SIZE and stats['key_bits'] <= AUTO_RADIX_MAX_BITS):
+        sortAlgo = 'radix'
+    else:
+        sortAlgo = 'integer spread'
+    return _record_auto_sort(sortAlgo, stats), stats
+
+# Backend for the fused solvers (gpi_weighted_job_scheduling and the columnar solver) with
+# sortAlgo='auto': jobs is a list of (start, end, weight) tuples, or pass the start and
+# end columns. The fused native kernels beat every Python-side sort on all measured
+# inputs, presorted ones included, so the profile decides between the integer_sort and
+# float_sort kernels: 'integer spread' when both starts and ends are int64-representable
+# integers, 'spread' otherwise. Returns (sortAlgo, {'starts': stats, 'ends': stats}).
+def choose_sort_algo(starts, ends=None, sample_size=AUTO_SAMPLE_SIZE):
+    if ends is None:
+        stats = {'starts': profile_sort_keys(starts, 0, sample_size), 'ends': profile_sort_keys(starts, 1, sample_size)}
+        fits = all(-2**63 <= column['min'] and column['max'] < 2**63
+                   for column in stats.values() if column['n'])
+    else:
+        starts, ends = np.asarray(starts), np.asarray(ends)
+        stats = {'starts': profile_sort_keys(starts, sample_size=sample_size),
+                 'ends': profile_sort_keys(ends, sample_size=sample_size)}
+        fits = np.uint64 not in (starts.dtype, ends.dtype)
+    integer = fits and all(column['integer'] for column in stats.values())
+    sortAlgo = 'integer spread' if integer else 'spread'
+    return _record_auto_sort(sortAlgo, stats), stats
+
+
+# 'spread' and 'integer spread' for list input. The fused native kernel runs both sorts,
+# the predecessor merge and the DP in one C++ call, in float64, so the optimum is a float.
+# Without the compiled extension the lean columnar path runs on the NumPy radix sorts
+# (float_radix_argsort, radix_argsort) and keeps the weights' type. Both raise TypeError
+# for 'integer spread' when a time is a float or outside int64.
+def _gpi_solve_spread(jobs, sortAlgo, return_jobs):
+    if boost_spreadsort is not None:
+        _phase('native')
+        if sortAlgo == 'integer spread':
+            return boost_spreadsort.gpi_solve_int(jobs, return_jobs)
+        return boost_spreadsort.gpi_solve(jobs, return_jobs)
+    result = gpi_weighted_job_scheduling_lean(jobs, sortAlgo, return_jobs)
+    return (result[0], result[1].tolist()) if return_jobs else result
 
 # Our novel O(n) Multi-Phase Preprocessing and DP Solution for WJS or WIS
-def gpi_weighted_job_scheduling(jobs, sortAlgo='default'):
+# presorted='end' skips the end sort for callers that guarantee end-time order; without
+# it, sorted, reversed and few-run inputs are detected by an O(n) probe (in the native
+# kernel as well), so the dominant sort cost drops out for feeds in completion order.
+def gpi_weighted_job_scheduling(jobs, sortAlgo='default', return_jobs=False, memory_lean=False, presorted=None):
+    _check_presorted(presorted)
+    if memory_lean:
+        return gpi_weighted_job_scheduling_lean(jobs, sortAlgo, return_jobs, presorted=presorted)
     n = len(jobs)
-    if sortAlgo == 'radix':
-        end_ordered = radix_sort(jobs, key_index=1)  # sort by end time, 0-indexed array
-        end_ordered = [(t[0], t[1], t[2], i+1) for i, t in enumerate(end_ordered)]
-        start_ordered = radix_sort(end_ordered, key_index=0)  # sort by start time, 0-indexed array
-    elif sortAlgo == 'bucket':
-        end_ordered = bucket_sort(jobs, key_index=1)  # sort by end time, 0-indexed array
-        end_ordered = [(t[0], t[1], t[2], i+1) for i, t in enumerate(end_ordered)]
-        start_ordered = bucket_sort(end_ordered, key_index=0)  # sort by start time, 0-indexed array
-    elif sortAlgo == 'recursive bucket':
-        end_ordered = recursive_adaptive_bucket_sort(jobs, key_index=1)  # sort by end time, 0-indexed array
-        end_ordered = [(t[0], t[1], t[2], i+1) for i, t in enumerate(end_ordered)]
-        start_ordered = recursive_adaptive_bucket_sort(end_ordered, key_index=0)  # sort by start time, 0-indexed array
-    elif sortAlgo == 'spread':
-        # Use the optimized function that does both sorts and adds indices in one C++ call
-        end_ordered, start_ordered = boost_spreadsort.float_sort_both_with_indices(jobs)
-    else:
-        end_ordered = sorted(jobs, key = lambda x: x[1])
-        end_ordered = [(t[0], t[1], t[2], i+1) for i, t in enumerate(end_ordered)]
-        start_ordered = sorted(end_ordered, key = lambda x: x[0])
+    if n == 0:
+        return (0, []) if return_jobs else 0
+    if sortAlgo == 'auto':
+        sortAlgo, stats = choose_sort_algo(jobs)
+        if sortAlgo == 'integer spread':
+            try:
+                return _gpi_solve_spread(jobs, sortAlgo, return_jobs)
+            except TypeError:  # an unsampled job has a float or out-of-range time
+                sortAlgo = _record_auto_sort('spread', dict(stats, rejected='integer spread'))
+    if sortAlgo in ('spread', 'integer spread'):
+        return _gpi_solve_spread(jobs, sortAlgo, return_jobs)
+    _phase('sort')
+    end_perm = None  # end order -> original index, only tracked when return_jobs
+    sort_by_key = _list_sort(sortAlgo)
+    if return_jobs:
+        jobs = [(t[0], t[1], t[2], k) for k, t in enumerate(jobs)]  # tag each job with its original index
+    end_ordered = jobs if presorted == 'end' else _sort_presorted(jobs, 1, sort_by_key)  # sort by end time, 0-indexed array
+    end_ordered = _zero_length_last(end_ordered)
+    if return_jobs:
+        end_perm = [t[3] for t in end_ordered]
+    end_ordered = [(t[0], t[1], t[2], i+1) for i, t in enumerate(end_ordered)]
+    start_ordered = _sort_presorted(end_ordered, 0, sort_by_key)  # sort by start time, 0-indexed array
 
+    _phase('predecessors')
     p = [0] * (n + 1) # apparently a 1-indexed array
     endIndex = find_pred(end_ordered, start_ordered[n-1][0])+1 # endIndex is made to be 1-indexed
     #endIndex = n
@@ -143,8 +563,9 @@ def gpi_weighted_job_scheduling(jobs, sortAlgo='default'):
             endIndex -= 1
         if endIndex <= 0:
             break
-        p[start_ordered[startIndex-1][3]] = endIndex
+        p[start_ordered[startIndex-1][3]] = min(endIndex, start_ordered[startIndex-1][3] - 1)  # see _cap_predecessors
     
+    _phase('dp')
     dp = [0] * (n + 1) #1-indexed
 
     for i in range(1, n + 1):
@@ -152,4 +573,338 @@ def gpi_weighted_job_scheduling(jobs, sortAlgo='default'):
         include = weight_i + dp[p[i]]
         dp[i] = max(dp[i - 1], include)
 
+    if return_jobs:
+        return dp[n], [end_perm[i - 1] for i in _traceback(dp, p.__getitem__)]
     return dp[n]
+
+
+# Split columnar input into (starts, ends, weights) 1-D NumPy arrays.
+# Accepts three separate columns, one structured array or one (n, 3) array.
+def _as_columns(starts, ends=None, weights=None):
+    if ends is None and weights is None:
+        jobs = np.asarray(starts)
+        if jobs.dtype.names is not None:
+            names = jobs.dtype.names
+            if all(name in names for name in ('start', 'end', 'weight')):
+                names = ('start', 'end', 'weight')
+            starts, ends, weights = (jobs[name] for name in names[:3])
+        elif jobs.ndim == 2 and jobs.shape[1] == 3:
+            starts, ends, weights = jobs[:, 0], jobs[:, 1], jobs[:, 2]
+        else:
+            raise ValueError("expected a structured array or an (n, 3) array of (start, end, weight)")
+    starts = np.ascontiguousarray(starts)
+    ends = np.ascontiguousarray(ends)
+    weights = np.ascontiguousarray(weights)
+    if not (starts.ndim == ends.ndim == weights.ndim == 1) or not (len(starts) == len(ends) == len(weights)):
+        raise ValueError("starts, ends and weights must be 1-D arrays of equal length")
+    return starts, ends, weights
+
+# Argsort of a key column, returned as an int64 permutation
+# The non-adaptive backends sit behind the O(n) presortedness probe: sorted keys need
+# no sort, and reversed, few-run or nearly sorted keys go to NumPy's stable argsort
+# (Timsort), which handles all three in about O(n). The integer backends check the key
+# type first, so presorted float keys are rejected like unsorted ones.
+def _argsort(keys, sortAlgo='default'):
+    if sortAlgo == 'auto':
+        sortAlgo, _ = choose_argsort_algo(keys)
+    if sortAlgo in ('radix', 'integer spread'):
+        _check_integer_keys(keys)
+    if sortAlgo != 'default':
+        order = _presortedness(keys)
+        if order == 'sorted':
+            return np.arange(len(keys), dtype=np.int64)
+        if order is not None:
+            sortAlgo = 'default'
+    if sortAlgo == 'spread':
+        if boost_spreadsort is None:
+            return float_radix_argsort(keys)
+        # Native argsort over compact (key, uint32 index) pairs
+        return boost_spreadsort.float_argsort(keys).astype(np.int64)
+    if sortAlgo == 'integer spread':
+        if boost_spreadsort is None:
+            return radix_argsort(keys)
+        return boost_spreadsort.integer_argsort(keys).astype(np.int64)
+    if sortAlgo == 'radix':
+        return radix_argsort(keys)
+    if sortAlgo == 'bucket':
+        return bucket_argsort(keys)
+    if sortAlgo == 'sample':
+        return sample_argsort(keys)
+    return np.argsort(keys, kind='stable').astype(np.int64, copy=False)
+
+# Vectorized GPI merge: for every start (in start order) count the ends <= it.
+# Both inputs are already sorted, so the stable sort over their concatenation is
+# a single O(n) run merge, and listing ends first keeps the `<=` tie semantics.
+def _gpi_predecessors(ends_sorted, starts_sorted):
+    merged_order = np.argsort(np.concatenate((ends_sorted, starts_sorted)), kind='stable')
+    start_positions = np.flatnonzero(merged_order >= len(ends_sorted))
+    return start_positions - np.arange(len(starts_sorted), dtype=np.int64)
+
+# Blocked GPI merge of the end-sorted ends and the start-sorted starts (arrays or
+# memmaps), yielding (offset, counts) with counts[k] = number of ends <= starts[offset + k].
+# Only O(chunk_size) temporaries are live at a time. A start below the last end of the
+# current block is final; the rest wait for the next block of ends.
+def _streaming_predecessors(ends, starts, chunk_size):
+    n = len(starts)
+    sp = ep = 0
+    while sp < n:
+        starts_block = np.array(starts[sp:sp + chunk_size])
+        ends_block = np.array(ends[ep:ep + chunk_size])
+        if ep + len(ends_block) == n or ends_block[-1] > starts_block[-1]:
+            resolved = len(starts_block)  # every remaining end past this block is larger
+        else:
+            resolved = np.searchsorted(starts_block, ends_block[-1], side='left')
+        if resolved:
+            counts = ep + _gpi_predecessors(ends_block, starts_block[:resolved])
+            yield sp, counts
+            sp += resolved
+        ep = counts[-1] if resolved == len(starts_block) else ep + len(ends_block)
+
+# Single-sort GPI preprocessing: sort one stream of 2n events (the n ends, then the
+# n starts) by time, and read both the end order and p off one linear sweep.
+# A start's predecessor count must include every end at the same time (the `<=`
+# of find_pred), so it is taken at the last event of its equal-time group. This
+# makes the result independent of tie order, so unstable backends work as well.
+# Returns (end_perm, p) like the two-sort path.
+def _gpi_event_sweep(starts, ends, sortAlgo='default'):
+    n = len(starts)
+    times = np.concatenate((ends, starts))
+    order = _argsort(times, sortAlgo)
+    is_end = order < n
+
+    end_perm = _zero_length_last_perm(order[is_end], starts, ends)  # end events in sorted order are the end order
+    ends_so_far = np.cumsum(is_end, dtype=np.int64)
+
+    sorted_times = times[order]
+    time_changes = sorted_times[1:] != sorted_times[:-1]
+    group_last = np.flatnonzero(np.append(time_changes, True))  # last event of each equal-time group
+    group_id = np.concatenate(([0], np.cumsum(time_changes)))
+    ends_through_group = ends_so_far[group_last[group_id]]
+
+    p_by_job = np.empty(n, dtype=np.int64)
+    p_by_job[order[~is_end] - n] = ends_through_group[~is_end]
+    return end_perm, p_by_job[end_perm]
+
+# DP over end-ordered weights and 1-indexed predecessors p; dp[0] = 0
+def _gpi_dp(p, weights):
+    n = len(p)
+    dp = np.zeros(n + 1, dtype=np.int64 if weights.dtype.kind in 'iub' else np.float64)
+    weights = weights.astype(dp.dtype, copy=False)
+    dp_view = memoryview(dp)
+    best = dp_view[0]
+    i = 0
+    for pred, weight in zip(memoryview(p), memoryview(weights)):
+        include = weight + dp_view[pred]
+        if include > best:
+            best = include
+        i += 1
+        dp_view[i] = best  # dp[i] = max(dp[i - 1], include)
+    return dp
+
+# Predecessors are counted among the jobs before each one in end order, so p[i] < i.
+# The count of ends <= start_i can reach i and beyond when end_i <= start_i (a
+# zero-length job also counts its own end and equal ends after it); the DP would then
+# read dp entries that are not computed yet. Caps p (0-based end order, 1-indexed
+# values) in place; jobs with end > start are unaffected.
+def _cap_predecessors(p):
+    np.minimum(p, np.arange(len(p), dtype=p.dtype), out=p)
+    return p
+
+# GPI preprocessing over columns: returns (end_perm, p), the end order as original
+# indices and the 1-indexed predecessor of each end-ordered job (0 if none)
+# Start order sorted from the end order: a job's start is at most its duration before
+# its end, so for short durations the starts read in end order are nearly sorted, and
+# the presortedness probe turns the second sort into Timsort's O(n)-ish run merge
+def _start_perm(starts, end_perm, sortAlgo='default'):
+    return end_perm[_argsort(starts[end_perm], sortAlgo)]
+
+def _gpi_prepare(starts, ends, sortAlgo='default', single_sort=False):
+    if single_sort:
+        end_perm, p = _gpi_event_sweep(starts, ends, sortAlgo)
+        return end_perm, _cap_predecessors(p)
+    end_perm = _argsort(ends, sortAlgo)  # end order -> original index
+    ends, starts = ends[end_perm], starts[end_perm]
+    tie_order = _zero_length_tie_order(starts, ends)
+    if tie_order is not None:
+        end_perm, ends, starts = end_perm[tie_order], ends[tie_order], starts[tie_order]
+    start_rank = _argsort(starts, sortAlgo)  # start order -> end-order position, as in _start_perm
+
+    p = np.empty(len(starts), dtype=np.int64)
+    p[start_rank] = _gpi_predecessors(ends, starts[start_rank])
+    return end_perm, _cap_predecessors(p)
+
+MULTI_DP_MIN_COLUMNS = 4
+
+# The GPI DP for K weight vectors at once: weights is (n, K) in end order and row i of
+# dp holds the K optima over the first i jobs. Each step is one vectorized max across
+# the K columns, so the per-step interpreter cost is shared by all scenarios.
+def _gpi_dp_multi(p, weights):
+    n, k = weights.shape
+    if 0 < k < MULTI_DP_MIN_COLUMNS:
+        # A NumPy call per step costs more than a few scalar DPs
+        return np.stack([_gpi_dp(p, np.ascontiguousarray(weights[:, c])) for c in range(k)], axis=1)
+    dp = np.zeros((n + 1, k), dtype=np.int64 if weights.dtype.kind in 'iub' else np.float64)
+    weights = weights.astype(dp.dtype, copy=False)
+    include = np.empty(k, dtype=dp.dtype)
+    for i, pred in enumerate(p.tolist()):
+        np.add(weights[i], dp[pred], out=include)
+        np.maximum(dp[i], include, out=dp[i + 1])
+    return dp
+
+# Traceback of every column of a multi-weight dp; returns one int64 array of original
+# indices per column
+def _traceback_multi(dp, p, end_perm):
+    p_view = memoryview(p)
+    selected = []
+    for column in np.ascontiguousarray(dp.T):
+        positions = _traceback(memoryview(column), lambda i: p_view[i - 1])
+        selected.append(end_perm[np.frombuffer(positions, dtype=np.int64) - 1])
+    return selected
+
+# GPI for many weighting scenarios over the same intervals (pricing models, Monte Carlo
+# weight samples, masks that zero out excluded jobs). The sorts and p depend only on
+# the times, so they are computed once; the DP then runs over the (n, K) weight matrix
+# with each step vectorized across the K columns. Returns the K optima as an array and,
+# with return_jobs=True, a list of K arrays of selected job indices.
+def gpi_weighted_job_scheduling_multi(starts, ends, weights, sortAlgo='default', return_jobs=False, single_sort=False):
+    starts = np.ascontiguousarray(starts)
+    ends = np.ascontiguousarray(ends)
+    weights = np.asarray(weights)
+    if weights.ndim == 1:
+        weights = weights[:, None]
+    n = len(starts)
+    if len(ends) != n or weights.ndim != 2 or weights.shape[0] != n:
+        raise ValueError("expected starts and ends of length n and an (n, K) weight matrix")
+    if n == 0:
+        optima = np.zeros(weights.shape[1], dtype=np.int64 if weights.dtype.kind in 'iub' else np.float64)
+        return (optima, [np.empty(0, dtype=np.int64) for _ in optima]) if return_jobs else optima
+
+    end_perm, p = _gpi_prepare(starts, ends, sortAlgo, single_sort)
+    dp = _gpi_dp_multi(p, weights[end_perm])
+    if return_jobs:
+        return dp[n].copy(), _traceback_multi(dp, p, end_perm)
+    return dp[n].copy()
+
+# Columnar GPI: same algorithm as gpi_weighted_job_scheduling, but over NumPy
+# columns with argsort permutations instead of per-job tuples
+def gpi_weighted_job_scheduling_columnar(starts, ends=None, weights=None, sortAlgo='default', return_jobs=False, single_sort=False):
+    starts, ends, weights = _as_columns(starts, ends, weights)
+    n = len(starts)
+    if n == 0:
+        return (0, np.empty(0, dtype=np.int64)) if return_jobs else 0
+    fused = not single_sort and boost_spreadsort is not None
+    if sortAlgo == 'auto' and fused:
+        sortAlgo, _ = choose_sort_algo(starts, ends)
+    if sortAlgo == 'spread' and fused:
+        # The native kernel reads the columns in place through the buffer protocol
+        return boost_spreadsort.gpi_solve(starts, ends, weights, return_jobs)
+    if sortAlgo == 'integer spread' and fused:
+        return boost_spreadsort.gpi_solve_int(starts, ends, weights, return_jobs)
+
+    end_perm, p = _gpi_prepare(starts, ends, sortAlgo, single_sort)
+    dp = _gpi_dp(p, weights[end_perm])
+    if return_jobs:
+        p_view = memoryview(p)
+        selected = _traceback(memoryview(dp), lambda i: p_view[i - 1])
+        return dp[n].item(), end_perm[np.frombuffer(selected, dtype=np.int64) - 1]
+    return dp[n].item()
+
+LEAN_CHUNK_SIZE = 1 << 16
+
+# One job field as a typed buffer, without building per-job tuples: int64 when every
+# value is an integer, float64 otherwise (the temporary list only holds references)
+def _job_column(jobs, index):
+    column = np.array(list(map(itemgetter(index), jobs)))
+    if column.dtype.kind not in 'iubf':
+        raise ValueError("job fields must be numeric")
+    return column.astype(np.int64 if column.dtype.kind in 'iub' else np.float64, copy=False)
+
+# Memory-lean GPI for list inputs: the jobs are read into three typed columns and all
+# working state lives in NumPy buffers (int32 ranks, p and permutations when n < 2^31),
+# about 45 bytes per job at peak instead of the 150+ of new tuples and ints in the
+# tuple-based path. Columns
+# are replaced by their sorted versions as soon as the originals are no longer needed,
+# and the predecessor merge runs in blocks of LEAN_CHUNK_SIZE. With return_footprint,
+# the peak bytes held in these buffers (including sort temporaries) is returned last.
+# presorted='end' skips the end sort, as in gpi_weighted_job_scheduling.
+def gpi_weighted_job_scheduling_lean(jobs, sortAlgo='default', return_jobs=False, return_footprint=False,
+                                     presorted=None):
+    _check_presorted(presorted)
+    n = len(jobs)
+    rank_dtype = np.int32 if n < 2**31 else np.int64
+    live = {}  # buffer name -> bytes, for the footprint
+    peak = 0
+
+    def hold(**arrays):
+        nonlocal peak
+        live.update((name, array.nbytes) for name, array in arrays.items())
+        peak = max(peak, sum(live.values()))
+
+    def drop(*names):
+        for name in names:
+            live.pop(name, None)
+
+    optimum, selected = 0, np.empty(0, dtype=np.int64)
+    if n:
+        _phase('sort')
+        ends = _job_column(jobs, 1)
+        hold(ends=ends)
+        end_perm = np.arange(n, dtype=np.int64) if presorted == 'end' else _argsort(ends, sortAlgo)
+        hold(end_perm_wide=end_perm)
+        end_perm = end_perm.astype(rank_dtype)
+        hold(end_perm=end_perm)
+        drop('end_perm_wide')
+        ends = ends[end_perm]
+        hold(sorted_ends=ends)
+        drop('ends')
+
+        weights = _job_column(jobs, 2)
+        hold(weights=weights)
+        weights = weights[end_perm]
+        hold(sorted_weights=weights)
+        drop('weights')
+
+        # Starts in end order (nearly sorted for short durations), then sorted; the sort
+        # permutation is the position of every start-ordered job in the end order
+        starts = _job_column(jobs, 0)
+        hold(starts=starts)
+        starts = starts[end_perm]
+        hold(starts_by_end=starts)
+        drop('starts')
+        tie_order = _zero_length_tie_order(starts, ends)
+        if tie_order is not None:
+            hold(tie_order=tie_order)
+            end_perm, ends, weights, starts = (column[tie_order] for column in (end_perm, ends, weights, starts))
+            del tie_order
+            drop('tie_order')
+        start_rank = _argsort(starts, sortAlgo)
+        hold(start_rank_wide=start_rank)
+        start_rank = start_rank.astype(rank_dtype)
+        hold(start_rank=start_rank)
+        drop('start_rank_wide')
+        starts = starts[start_rank]
+        hold(sorted_starts=starts)
+        drop('starts_by_end')
+
+        _phase('predecessors')
+        p = np.zeros(n, dtype=rank_dtype)  # 1-indexed predecessor of each end-ordered job
+        hold(p=p, merge_block=np.empty(4 * min(n, LEAN_CHUNK_SIZE), dtype=np.int64))
+        for lo, counts in _streaming_predecessors(ends, starts, LEAN_CHUNK_SIZE):
+            p[start_rank[lo:lo + len(counts)]] = counts
+        _cap_predecessors(p)
+        del ends, starts, start_rank
+        drop('sorted_ends', 'sorted_starts', 'start_rank', 'merge_block')
+
+        _phase('dp')
+        dp = _gpi_dp(p, weights)
+        hold(dp=dp)
+        optimum = dp[n].item()
+        if return_jobs:
+            p_view = memoryview(p)
+            positions = _traceback(memoryview(dp), lambda i: p_view[i - 1])
+            selected = end_perm[np.frombuffer(positions, dtype=np.int64) - 1].astype(np.int64)
+
+    result = (optimum, selected) if return_jobs else optimum
+    if return_footprint:
+        return (result + (peak,)) if return_jobs else (optimum, peak)
+    return result
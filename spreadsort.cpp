@@ -1,7 +1,10 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
+#include <pybind11/numpy.h>
 #include <boost/sort/spreadsort/float_sort.hpp>
+#include <boost/sort/spreadsort/integer_sort.hpp>
 #include <vector>
+#include <cstdint>
 #include <tuple>
 #include <algorithm>
 #include <stdexcept>
@@ -28,135 +31,280 @@ std::vector<double> float_sort_doubles(std::vector<double> vals) {
     return vals;
 }
 
-// Custom struct for 3-tuples that can be sorted by spreadsort
-struct SortableTuple3 {
+// Compact sort record: a float key and the uint32 index of the row it came from.
+// 16 bytes instead of the 32-48 byte tuple records, so float_sort moves far less data.
+struct KeyIndex {
     double key;
-    std::tuple<double, double, double> data;
-    
-    SortableTuple3(double k, const std::tuple<double, double, double>& d) 
-        : key(k), data(d) {}
-    
-    // Conversion operator for spreadsort
-    operator double() const { return key; }
+    uint32_t index;
+
+    KeyIndex() : key(0.0), index(0) {}
+    KeyIndex(double k, uint32_t i) : key(k), index(i) {}
 };
 
-// Custom struct for 4-tuples that can be sorted by spreadsort
-struct SortableTuple4 {
-    double key;
-    std::tuple<double, double, double, int> data;
-    
-    SortableTuple4(double k, const std::tuple<double, double, double, int>& d) 
-        : key(k), data(d) {}
-    
-    // Conversion operator for spreadsort
-    operator double() const { return key; }
+// float_sort only radix-sorts plain 4/8-byte floats by itself; any other record type
+// falls back to a comparison sort unless it is given the key's bits through a shift
+// functor, as integer_sort is for IntKeyIndex
+struct KeyRightShift {
+    int64_t operator()(const KeyIndex& x, unsigned offset) const { return float_mem_cast<double, int64_t>(x.key) >> offset; }
 };
 
-// Sort 3-tuples by float key using float_sort on custom structs
-std::vector<std::tuple<double, double, double>> float_sort_tuples_by_key(
-    const std::vector<std::tuple<double, double, double>>& jobs, int key_index) {
+struct KeyLess {
+    bool operator()(const KeyIndex& a, const KeyIndex& b) const { return a.key < b.key; }
+};
+
+void check_argsort_size(size_t n) {
+    if (n > static_cast<size_t>(UINT32_MAX)) {
+        throw std::length_error("argsort supports at most 2^32 - 1 elements");
+    }
+}
+
+// Ascending runs up to which presorted input is merged instead of fully sorted
+constexpr size_t PRESORTED_MAX_RUNS = 32;
+
+// Presortedness probe in front of a spreadsort pass: one O(n) scan counts the descents
+// and ascents. Sorted input is left as is, non-increasing input is reversed, and up to
+// PRESORTED_MAX_RUNS ascending runs are merged pairwise with std::inplace_merge in
+// O(n log runs). Returns false when the pairs still need the full sort.
+template <typename Pair>
+bool sort_presorted(std::vector<Pair>& pairs) {
+    size_t n = pairs.size();
+    std::vector<size_t> run_starts{0};
+    size_t descents = 0, ascents = 0;
+    for (size_t i = 1; i < n; ++i) {
+        if (pairs[i].key < pairs[i - 1].key) {
+            if (++descents < PRESORTED_MAX_RUNS) {
+                run_starts.push_back(i);
+            }
+        } else if (pairs[i - 1].key < pairs[i].key) {
+            ++ascents;
+        }
+    }
+    if (descents == 0) {
+        return true;
+    }
+    if (ascents == 0) {
+        std::reverse(pairs.begin(), pairs.end());
+        return true;
+    }
+    if (descents >= PRESORTED_MAX_RUNS) {
+        return false;
+    }
+    auto key_less = [](const Pair& a, const Pair& b) { return a.key < b.key; };
+    run_starts.push_back(n);
+    while (run_starts.size() > 2) {
+        std::vector<size_t> merged{0};
+        for (size_t r = 0; r + 2 < run_starts.size(); r += 2) {
+            std::inplace_merge(pairs.begin() + run_starts[r], pairs.begin() + run_starts[r + 1],
+                               pairs.begin() + run_starts[r + 2], key_less);
+            merged.push_back(run_starts[r + 2]);
+        }
+        if (merged.back() != n) {
+            merged.push_back(n);  // odd run out, merged in the next round
+        }
+        run_starts.swap(merged);
+    }
+    return true;
+}
+
+// Insertion-sort moves allowed per key before a nearly sorted pass gives up
+constexpr size_t NEAR_SORTED_MOVES_PER_KEY = 8;
+
+// Insertion sort of nearly sorted pairs in O(n + inversions), e.g. start keys read in
+// end order when durations are short. Gives up (returns false, leaving a permutation
+// of the pairs) once the moves exceed NEAR_SORTED_MOVES_PER_KEY per key so far, with
+// some slack at the start, so unsorted input costs little before the full sort.
+template <typename Pair>
+bool insertion_sort_near_sorted(std::vector<Pair>& pairs) {
+    size_t moves = 0;
+    for (size_t i = 1; i < pairs.size(); ++i) {
+        if (!(pairs[i].key < pairs[i - 1].key)) {
+            continue;
+        }
+        Pair item = pairs[i];
+        size_t j = i;
+        while (j > 0 && item.key < pairs[j - 1].key) {
+            pairs[j] = pairs[j - 1];
+            --j;
+        }
+        pairs[j] = item;
+        moves += i - j;
+        if (moves > NEAR_SORTED_MOVES_PER_KEY * (i + 1024)) {
+            return false;
+        }
+    }
+    return true;
+}
+
+void spread_sort_pairs(std::vector<KeyIndex>& pairs) {
+    float_sort(pairs.begin(), pairs.end(), KeyRightShift(), KeyLess());
+}
+
+// Sort (key, index) pairs for a possibly strided key column
+std::vector<KeyIndex> sort_key_index(const double* keys, size_t n, size_t stride = 1) {
+    check_argsort_size(n);
+    std::vector<KeyIndex> pairs;
+    pairs.reserve(n);
+    for (size_t i = 0; i < n; ++i) {
+        pairs.emplace_back(keys[i * stride], static_cast<uint32_t>(i));
+    }
+    if (!sort_presorted(pairs)) {
+        spread_sort_pairs(pairs);
+    }
+    return pairs;
+}
+
+// Compact sort record for int64 keys (epoch seconds, milliseconds, bounded integer times)
+struct IntKeyIndex {
+    int64_t key;
+    uint32_t index;
+
+    IntKeyIndex() : key(0), index(0) {}
+    IntKeyIndex(int64_t k, uint32_t i) : key(k), index(i) {}
+};
+
+struct IntKeyRightShift {
+    int64_t operator()(const IntKeyIndex& x, unsigned offset) const { return x.key >> offset; }
+};
+
+struct IntKeyLess {
+    bool operator()(const IntKeyIndex& a, const IntKeyIndex& b) const { return a.key < b.key; }
+};
+
+void spread_sort_pairs(std::vector<IntKeyIndex>& pairs) {
+    integer_sort(pairs.begin(), pairs.end(), IntKeyRightShift(), IntKeyLess());
+}
+
+// Sort (key, index) pairs for a possibly strided int64 key column using integer_sort
+std::vector<IntKeyIndex> sort_key_index(const int64_t* keys, size_t n, size_t stride = 1) {
+    check_argsort_size(n);
+    std::vector<IntKeyIndex> pairs;
+    pairs.reserve(n);
+    for (size_t i = 0; i < n; ++i) {
+        pairs.emplace_back(keys[i * stride], static_cast<uint32_t>(i));
+    }
+    if (!sort_presorted(pairs)) {
+        spread_sort_pairs(pairs);
+    }
+    return pairs;
+}
+
+// Argsort over int64 keys using integer_sort
+std::vector<uint32_t> integer_argsort_keys(const int64_t* keys, size_t n, size_t stride = 1) {
+    std::vector<IntKeyIndex> pairs = sort_key_index(keys, n, stride);
+    std::vector<uint32_t> perm;
+    perm.reserve(n);
+    for (const auto& pair : pairs) {
+        perm.push_back(pair.index);
+    }
+    return perm;
+}
+
+// Argsort of a list of integers
+std::vector<uint32_t> integer_argsort(const std::vector<int64_t>& keys) {
+    return integer_argsort_keys(keys.data(), keys.size());
+}
+
+// Argsort integer-time jobs by end time and by start time: returns (end_perm, start_perm)
+py::tuple integer_argsort_both(const std::vector<std::tuple<int64_t, int64_t, double>>& jobs) {
     size_t n = jobs.size();
-    
-    // Create sortable structs
-    std::vector<SortableTuple3> sortable_jobs;
-    sortable_jobs.reserve(n);
+    std::vector<int64_t> starts, ends;
+    starts.reserve(n);
+    ends.reserve(n);
     for (const auto& job : jobs) {
-        double key = (key_index == 0) ? std::get<0>(job) : std::get<1>(job);
-        sortable_jobs.emplace_back(key, job);
+        starts.push_back(std::get<0>(job));
+        ends.push_back(std::get<1>(job));
     }
-    
-    // Sort using float_sort (spreadsort)
-    float_sort(sortable_jobs.begin(), sortable_jobs.end());
-    
-    // Extract sorted tuples
+    return py::make_tuple(py::cast(integer_argsort_keys(ends.data(), n)), py::cast(integer_argsort_keys(starts.data(), n)));
+}
+
+// Argsort over float keys: returns only the permutation (perm[i] = index of the i-th smallest key)
+std::vector<uint32_t> float_argsort_keys(const double* keys, size_t n, size_t stride = 1) {
+    std::vector<KeyIndex> pairs = sort_key_index(keys, n, stride);
+    std::vector<uint32_t> perm;
+    perm.reserve(n);
+    for (const auto& pair : pairs) {
+        perm.push_back(pair.index);
+    }
+    return perm;
+}
+
+// Argsort a tuple column by gathering its key once, then sorting compact pairs
+template <typename Tuple>
+std::vector<uint32_t> float_argsort_tuples(const std::vector<Tuple>& jobs, int key_index) {
+    std::vector<double> keys;
+    keys.reserve(jobs.size());
+    for (const auto& job : jobs) {
+        keys.push_back((key_index == 0) ? std::get<0>(job) : std::get<1>(job));
+    }
+    return float_argsort_keys(keys.data(), keys.size());
+}
+
+// Argsort of a list of floats
+std::vector<uint32_t> float_argsort(const std::vector<double>& keys) {
+    return float_argsort_keys(keys.data(), keys.size());
+}
+
+// Sort 3-tuples by float key: argsort, then gather
+std::vector<std::tuple<double, double, double>> float_sort_tuples_by_key(
+    const std::vector<std::tuple<double, double, double>>& jobs, int key_index) {
+    std::vector<uint32_t> perm = float_argsort_tuples(jobs, key_index);
     std::vector<std::tuple<double, double, double>> sorted_jobs;
-    sorted_jobs.reserve(n);
-    for (const auto& item : sortable_jobs) {
-        sorted_jobs.push_back(item.data);
+    sorted_jobs.reserve(jobs.size());
+    for (uint32_t index : perm) {
+        sorted_jobs.push_back(jobs[index]);
     }
-    
     return sorted_jobs;
 }
 
-// Sort 4-tuples by float key using float_sort on custom structs
+// Sort 4-tuples by float key: argsort, then gather
 std::vector<std::tuple<double, double, double, int>> float_sort_tuples_4_by_key(
     const std::vector<std::tuple<double, double, double, int>>& jobs, int key_index) {
-    size_t n = jobs.size();
-    
-    // Create sortable structs
-    std::vector<SortableTuple4> sortable_jobs;
-    sortable_jobs.reserve(n);
-    for (const auto& job : jobs) {
-        double key = (key_index == 0) ? std::get<0>(job) : std::get<1>(job);
-        sortable_jobs.emplace_back(key, job);
-    }
-    
-    // Sort using float_sort (spreadsort)
-    float_sort(sortable_jobs.begin(), sortable_jobs.end());
-    
-    // Extract sorted tuples
+    std::vector<uint32_t> perm = float_argsort_tuples(jobs, key_index);
     std::vector<std::tuple<double, double, double, int>> sorted_jobs;
-    sorted_jobs.reserve(n);
-    for (const auto& item : sortable_jobs) {
-        sorted_jobs.push_back(item.data);
+    sorted_jobs.reserve(jobs.size());
+    for (uint32_t index : perm) {
+        sorted_jobs.push_back(jobs[index]);
     }
-    
     return sorted_jobs;
 }
 
-// Combined function that does both sorts and adds indices in one call, returning a Python tuple
-py::tuple float_sort_both_with_indices(const std::vector<std::tuple<double, double, double>>& jobs) {
-    auto total_start = get_time();
+// Argsort jobs by end time and by start time in one call: returns (end_perm, start_perm),
+// both as indices into the caller's jobs
+py::tuple float_argsort_both(const std::vector<std::tuple<double, double, double>>& jobs) {
+    std::vector<uint32_t> end_perm = float_argsort_tuples(jobs, 1);
+    std::vector<uint32_t> start_perm = float_argsort_tuples(jobs, 0);
+    return py::make_tuple(py::cast(end_perm), py::cast(start_perm));
+}
+
+// Gather (start, end, weight, end rank) tuples for the end and start orders
+py::tuple gather_both_with_indices(const std::vector<std::tuple<double, double, double>>& jobs,
+                                   const std::vector<uint32_t>& end_perm, const std::vector<uint32_t>& start_perm) {
     size_t n = jobs.size();
-    
-    // First sort by end time (index 1) - WITHOUT indices yet
-    auto end_sort_start = get_time();
-    std::vector<SortableTuple3> sortable_end;
-    sortable_end.reserve(n);
-    for (const auto& job : jobs) {
-        double key = std::get<1>(job);  // end time
-        sortable_end.emplace_back(key, job);
-    }
-    auto end_sort_mid = get_time();
-    float_sort(sortable_end.begin(), sortable_end.end());
-    auto end_sort_end = get_time();
-    
-    // Extract end-ordered jobs and ADD INDICES HERE (like the Python list comprehension)
-    auto index_add_start = get_time();
+    std::vector<int> end_rank(n);  // original index -> 1-indexed end rank
     std::vector<std::tuple<double, double, double, int>> end_sorted;
     end_sorted.reserve(n);
     for (size_t i = 0; i < n; ++i) {
-        const auto& item = sortable_end[i];
-        end_sorted.emplace_back(std::get<0>(item.data), std::get<1>(item.data), std::get<2>(item.data), i + 1);
-    }
-    auto index_add_end = get_time();
-    
-    // Now sort by start time (index 0) for start-ordered jobs
-    auto start_sort_start = get_time();
-    std::vector<SortableTuple4> sortable_start;
-    sortable_start.reserve(n);
-    for (const auto& job : end_sorted) {
-        double key = std::get<0>(job);  // start time
-        sortable_start.emplace_back(key, job);
+        const auto& job = jobs[end_perm[i]];
+        end_rank[end_perm[i]] = static_cast<int>(i + 1);
+        end_sorted.emplace_back(std::get<0>(job), std::get<1>(job), std::get<2>(job), static_cast<int>(i + 1));
     }
-    auto start_sort_mid = get_time();
-    float_sort(sortable_start.begin(), sortable_start.end());
-    auto start_sort_end = get_time();
-    
-    // Extract start-ordered jobs
-    auto final_extract_start = get_time();
+
     std::vector<std::tuple<double, double, double, int>> start_sorted;
     start_sorted.reserve(n);
-    for (const auto& item : sortable_start) {
-        start_sorted.push_back(item.data);
+    for (uint32_t index : start_perm) {
+        const auto& job = jobs[index];
+        start_sorted.emplace_back(std::get<0>(job), std::get<1>(job), std::get<2>(job), end_rank[index]);
     }
-    auto final_extract_end = get_time();
-    
-    auto total_end = get_time();
-    
     return py::make_tuple(py::cast(end_sorted), py::cast(start_sorted));
 }
 
+// Combined function that does both sorts and adds indices in one call, returning a Python tuple
+py::tuple float_sort_both_with_indices(const std::vector<std::tuple<double, double, double>>& jobs) {
+    std::vector<uint32_t> end_perm = float_argsort_tuples(jobs, 1);
+    std::vector<uint32_t> start_perm = float_argsort_tuples(jobs, 0);
+    return gather_both_with_indices(jobs, end_perm, start_perm);
+}
+
 // Optimized struct for better performance
 struct Job {
     double start, end, weight;
@@ -265,11 +413,331 @@ py::tuple float_sort_both_with_indices_optimized(const std::vector<std::tuple<do
     return py::make_tuple(py::cast(end_sorted), py::cast(start_sorted));
 }
 
+// Result of the fused GPI kernel
+struct GpiResult {
+    double optimum;
+    std::vector<int64_t> selected;  // original indices of the chosen jobs, in end order
+};
+
+// Fused GPI: both sort passes, the predecessor merge, the DP and (optionally)
+// the traceback, all over raw columns so nothing crosses back into Python per job.
+// Double keys go through float_sort and int64 keys through integer_sort.
+// Columns may be strided (stride 3 for the rows of a C-contiguous (n, 3) array).
+template <typename Key, typename Weight>
+GpiResult gpi_solve_columns(const Key* starts, const Key* ends, const Weight* weights, size_t n, bool return_jobs, size_t stride = 1) {
+    GpiResult result{0.0, {}};
+    if (n == 0) {
+        return result;
+    }
+
+    // End order: by_end[i].index = original index of the (i+1)-th job by end time
+    auto by_end = sort_key_index(ends, n, stride);
+    // A zero-length job is compatible with every job ending at its time, and the DP only
+    // chains it after jobs before it, so it goes last among equal ends
+    for (size_t lo = 0, hi; lo < n; lo = hi) {
+        for (hi = lo + 1; hi < n && by_end[hi].key == by_end[lo].key; ++hi) {
+        }
+        if (hi - lo > 1) {
+            std::stable_partition(by_end.begin() + lo, by_end.begin() + hi, [&](const auto& pair) {
+                return starts[static_cast<size_t>(pair.index) * stride] < pair.key;
+            });
+        }
+    }
+
+    std::vector<uint32_t> end_rank(n);  // original index -> 1-indexed end rank
+    for (size_t i = 0; i < n; ++i) {
+        end_rank[by_end[i].index] = static_cast<uint32_t>(i + 1);
+    }
+
+    // Start order, sorted from the end order: for short durations the starts read in
+    // end order are nearly sorted, and the insertion pass finishes in about O(n)
+    auto by_start = by_end;
+    for (auto& pair : by_start) {
+        pair.key = starts[static_cast<size_t>(pair.index) * stride];
+    }
+    if (!sort_presorted(by_start) && !insertion_sort_near_sorted(by_start)) {
+        spread_sort_pairs(by_start);
+    }
+
+    // GPI predecessor merge: one forward walk over both orders, p[rank] = #ends <= start,
+    // capped at rank - 1: predecessors come before the job in end order, which a
+    // zero-length job's own end (and equal ends after it) would otherwise break
+    std::vector<int64_t> p(n + 1, 0);
+    size_t end_index = 0;
+    for (size_t k = 0; k < n; ++k) {
+        Key start = by_start[k].key;
+        while (end_index < n && by_end[end_index].key <= start) {
+            ++end_index;
+        }
+        int64_t rank = end_rank[by_start[k].index];
+        p[rank] = std::min(static_cast<int64_t>(end_index), rank - 1);
+    }
+
+    // DP over end order, dp[0] = 0
+    std::vector<double> dp(n + 1, 0.0);
+    for (size_t i = 1; i <= n; ++i) {
+        double include = static_cast<double>(weights[static_cast<size_t>(by_end[i - 1].index) * stride]) + dp[p[i]];
+        dp[i] = std::max(dp[i - 1], include);
+    }
+    result.optimum = dp[n];
+
+    if (return_jobs) {
+        // Job i is taken exactly when dp[i] > dp[i - 1]
+        size_t i = n;
+        while (i > 0) {
+            if (dp[i] != dp[i - 1]) {
+                result.selected.push_back(by_end[i - 1].index);
+                i = static_cast<size_t>(p[i]);
+            } else {
+                --i;
+            }
+        }
+        std::reverse(result.selected.begin(), result.selected.end());
+    }
+    return result;
+}
+
+// Solve weighted job scheduling with GPI in one native call. Returns the optimum,
+// or (optimum, selected original indices) when return_jobs is set
+py::object gpi_solve(const std::vector<std::tuple<double, double, double>>& jobs, bool return_jobs) {
+    size_t n = jobs.size();
+    std::vector<double> starts, ends, weights;
+    starts.reserve(n);
+    ends.reserve(n);
+    weights.reserve(n);
+    for (const auto& job : jobs) {
+        starts.push_back(std::get<0>(job));
+        ends.push_back(std::get<1>(job));
+        weights.push_back(std::get<2>(job));
+    }
+
+    GpiResult result = gpi_solve_columns(starts.data(), ends.data(), weights.data(), n, return_jobs);
+    if (return_jobs) {
+        return py::make_tuple(result.optimum, py::cast(result.selected));
+    }
+    return py::float_(result.optimum);
+}
+
+// Same as gpi_solve, for integer start/end times sorted with integer_sort
+py::object gpi_solve_int(const std::vector<std::tuple<int64_t, int64_t, double>>& jobs, bool return_jobs) {
+    size_t n = jobs.size();
+    std::vector<int64_t> starts, ends;
+    std::vector<double> weights;
+    starts.reserve(n);
+    ends.reserve(n);
+    weights.reserve(n);
+    for (const auto& job : jobs) {
+        starts.push_back(std::get<0>(job));
+        ends.push_back(std::get<1>(job));
+        weights.push_back(std::get<2>(job));
+    }
+
+    GpiResult result = gpi_solve_columns(starts.data(), ends.data(), weights.data(), n, return_jobs);
+    if (return_jobs) {
+        return py::make_tuple(result.optimum, py::cast(result.selected));
+    }
+    return py::float_(result.optimum);
+}
+
+// NumPy buffer-protocol overloads. They accept only ndarrays (lists keep using the
+// std::vector overloads), read them in place unless they need a cast to C-contiguous
+// float64, and return NumPy arrays that take ownership of the C++ vector instead of copying it.
+using DoubleArray = py::array_t<double, py::array::c_style | py::array::forcecast>;
+
+DoubleArray as_double_array(const py::array& arr) {
+    return DoubleArray::ensure(arr);
+}
+
+using Int64Array = py::array_t<int64_t, py::array::c_style | py::array::forcecast>;
+
+// Integer keys must not silently truncate floats, so only integer/bool dtypes are cast
+Int64Array as_int64_array(const py::array& arr) {
+    char kind = arr.dtype().kind();
+    if (kind != 'i' && kind != 'u' && kind != 'b') {
+        throw std::invalid_argument("integer_sort requires an integer array");
+    }
+    Int64Array result = Int64Array::ensure(arr);
+    if (!result) {
+        throw py::error_already_set();
+    }
+    return result;
+}
+
+template <typename T>
+py::array_t<T> vector_to_numpy(std::vector<T>&& vec, std::vector<py::ssize_t> shape) {
+    auto* owned = new std::vector<T>(std::move(vec));
+    py::capsule free_when_done(owned, [](void* ptr) { delete reinterpret_cast<std::vector<T>*>(ptr); });
+    return py::array_t<T>(shape, owned->data(), free_when_done);
+}
+
+template <typename T>
+py::array_t<T> vector_to_numpy(std::vector<T>&& vec) {
+    py::ssize_t n = static_cast<py::ssize_t>(vec.size());
+    return vector_to_numpy(std::move(vec), {n});
+}
+
+void check_jobs_array(const DoubleArray& jobs) {
+    if (!jobs) {
+        throw py::error_already_set();
+    }
+    if (jobs.ndim() != 2 || jobs.shape(1) != 3) {
+        throw std::invalid_argument("jobs array must have shape (n, 3)");
+    }
+}
+
+// Sort a 1-D array of doubles using float_sort
+py::array_t<double> float_sort_doubles_array(const py::array& arr) {
+    DoubleArray vals = as_double_array(arr);
+    if (!vals) {
+        throw py::error_already_set();
+    }
+    if (vals.ndim() != 1) {
+        throw std::invalid_argument("vals must be a 1-D array");
+    }
+    std::vector<double> sorted(vals.data(), vals.data() + vals.size());
+    float_sort(sorted.begin(), sorted.end());
+    return vector_to_numpy(std::move(sorted));
+}
+
+// Sort the rows of an (n, 3) jobs array by column key_index using float_sort
+py::array_t<double> float_sort_tuples_by_key_array(const py::array& arr, int key_index) {
+    DoubleArray jobs = as_double_array(arr);
+    check_jobs_array(jobs);
+    size_t n = static_cast<size_t>(jobs.shape(0));
+    const double* data = jobs.data();
+
+    std::vector<uint32_t> perm = float_argsort_keys(data + (key_index == 0 ? 0 : 1), n, 3);
+
+    std::vector<double> sorted(3 * n);
+    for (size_t i = 0; i < n; ++i) {
+        const double* row = data + 3 * static_cast<size_t>(perm[i]);
+        std::copy(row, row + 3, sorted.begin() + 3 * i);
+    }
+    return vector_to_numpy(std::move(sorted), {static_cast<py::ssize_t>(n), 3});
+}
+
+py::object gpi_result_to_python(GpiResult&& result, bool return_jobs) {
+    if (return_jobs) {
+        return py::make_tuple(result.optimum, vector_to_numpy(std::move(result.selected)));
+    }
+    return py::float_(result.optimum);
+}
+
+// gpi_solve over three 1-D columns
+py::object gpi_solve_arrays(const py::array& start_arr, const py::array& end_arr, const py::array& weight_arr, bool return_jobs) {
+    DoubleArray starts = as_double_array(start_arr);
+    DoubleArray ends = as_double_array(end_arr);
+    DoubleArray weights = as_double_array(weight_arr);
+    if (!starts || !ends || !weights) {
+        throw py::error_already_set();
+    }
+    if (starts.ndim() != 1 || ends.ndim() != 1 || weights.ndim() != 1
+        || starts.size() != ends.size() || starts.size() != weights.size()) {
+        throw std::invalid_argument("starts, ends and weights must be 1-D arrays of equal length");
+    }
+    GpiResult result = gpi_solve_columns(starts.data(), ends.data(), weights.data(), static_cast<size_t>(starts.size()), return_jobs);
+    return gpi_result_to_python(std::move(result), return_jobs);
+}
+
+// gpi_solve over one (n, 3) array of (start, end, weight) rows
+py::object gpi_solve_array(const py::array& arr, bool return_jobs) {
+    DoubleArray jobs = as_double_array(arr);
+    check_jobs_array(jobs);
+    const double* data = jobs.data();
+    GpiResult result = gpi_solve_columns(data, data + 1, data + 2, static_cast<size_t>(jobs.shape(0)), return_jobs, 3);
+    return gpi_result_to_python(std::move(result), return_jobs);
+}
+
+// Argsort of a 1-D NumPy array of float keys, returned as a uint32 NumPy permutation
+py::array_t<uint32_t> float_argsort_array(const py::array& arr) {
+    DoubleArray keys = as_double_array(arr);
+    if (!keys) {
+        throw py::error_already_set();
+    }
+    if (keys.ndim() != 1) {
+        throw std::invalid_argument("keys must be a 1-D array");
+    }
+    return vector_to_numpy(float_argsort_keys(keys.data(), static_cast<size_t>(keys.size())));
+}
+
+// Argsort the rows of an (n, 3) jobs array by end and by start: returns (end_perm, start_perm)
+py::tuple float_argsort_both_array(const py::array& arr) {
+    DoubleArray jobs = as_double_array(arr);
+    check_jobs_array(jobs);
+    size_t n = static_cast<size_t>(jobs.shape(0));
+    return py::make_tuple(vector_to_numpy(float_argsort_keys(jobs.data() + 1, n, 3)),
+                          vector_to_numpy(float_argsort_keys(jobs.data(), n, 3)));
+}
+
+// Argsort of a 1-D NumPy array of integer keys using integer_sort
+py::array_t<uint32_t> integer_argsort_array(const py::array& arr) {
+    Int64Array keys = as_int64_array(arr);
+    if (keys.ndim() != 1) {
+        throw std::invalid_argument("keys must be a 1-D array");
+    }
+    return vector_to_numpy(integer_argsort_keys(keys.data(), static_cast<size_t>(keys.size())));
+}
+
+// Argsort the rows of an (n, 3) integer jobs array by end and by start: returns (end_perm, start_perm)
+py::tuple integer_argsort_both_array(const py::array& arr) {
+    Int64Array jobs = as_int64_array(arr);
+    if (jobs.ndim() != 2 || jobs.shape(1) != 3) {
+        throw std::invalid_argument("jobs array must have shape (n, 3)");
+    }
+    size_t n = static_cast<size_t>(jobs.shape(0));
+    return py::make_tuple(vector_to_numpy(integer_argsort_keys(jobs.data() + 1, n, 3)),
+                          vector_to_numpy(integer_argsort_keys(jobs.data(), n, 3)));
+}
+
+// gpi_solve_int over integer start and end columns and a weight column
+py::object gpi_solve_int_arrays(const py::array& start_arr, const py::array& end_arr, const py::array& weight_arr, bool return_jobs) {
+    Int64Array starts = as_int64_array(start_arr);
+    Int64Array ends = as_int64_array(end_arr);
+    DoubleArray weights = as_double_array(weight_arr);
+    if (!weights) {
+        throw py::error_already_set();
+    }
+    if (starts.ndim() != 1 || ends.ndim() != 1 || weights.ndim() != 1
+        || starts.size() != ends.size() || starts.size() != weights.size()) {
+        throw std::invalid_argument("starts, ends and weights must be 1-D arrays of equal length");
+    }
+    GpiResult result = gpi_solve_columns(starts.data(), ends.data(), weights.data(), static_cast<size_t>(starts.size()), return_jobs);
+    return gpi_result_to_python(std::move(result), return_jobs);
+}
+
+// gpi_solve_int over one (n, 3) integer array of (start, end, weight) rows
+py::object gpi_solve_int_array(const py::array& arr, bool return_jobs) {
+    Int64Array jobs = as_int64_array(arr);
+    if (jobs.ndim() != 2 || jobs.shape(1) != 3) {
+        throw std::invalid_argument("jobs array must have shape (n, 3)");
+    }
+    const int64_t* data = jobs.data();
+    GpiResult result = gpi_solve_columns(data, data + 1, data + 2, static_cast<size_t>(jobs.shape(0)), return_jobs, 3);
+    return gpi_result_to_python(std::move(result), return_jobs);
+}
+
 PYBIND11_MODULE(boost_spreadsort, m) {
     m.doc() = "Boost Spreadsort bindings using pybind11";
+    // NumPy overloads are registered first so that arrays never go through the element-wise list conversion
+    m.def("float_sort_doubles", &float_sort_doubles_array, "Sort a 1-D NumPy array of doubles using float_sort", py::arg("vals"));
     m.def("float_sort_doubles", &float_sort_doubles, "Sort vector of doubles using float_sort", py::arg("vals"));
+    m.def("float_sort_tuples_by_key", &float_sort_tuples_by_key_array, "Sort the rows of an (n, 3) NumPy array by float key using float_sort", py::arg("jobs"), py::arg("key_index"));
     m.def("float_sort_tuples_by_key", &float_sort_tuples_by_key, "Sort 3-tuples by float key using float_sort", py::arg("jobs"), py::arg("key_index"));
     m.def("float_sort_tuples_4_by_key", &float_sort_tuples_4_by_key, "Sort 4-tuples by float key using float_sort", py::arg("jobs"), py::arg("key_index"));
+    m.def("float_argsort", &float_argsort_array, "Argsort a 1-D NumPy array of float keys, returning a uint32 permutation", py::arg("keys"));
+    m.def("float_argsort", &float_argsort, "Argsort a list of float keys, returning the permutation", py::arg("keys"));
+    m.def("float_argsort_both", &float_argsort_both_array, "Argsort an (n, 3) NumPy jobs array by end and by start time", py::arg("jobs"));
+    m.def("float_argsort_both", &float_argsort_both, "Argsort jobs by end and by start time, returning (end_perm, start_perm)", py::arg("jobs"));
+    m.def("integer_argsort", &integer_argsort_array, "Argsort a 1-D NumPy array of integer keys using integer_sort", py::arg("keys"));
+    m.def("integer_argsort", &integer_argsort, "Argsort a list of integer keys using integer_sort", py::arg("keys"));
+    m.def("integer_argsort_both", &integer_argsort_both_array, "Argsort an (n, 3) integer NumPy jobs array by end and by start time", py::arg("jobs"));
+    m.def("integer_argsort_both", &integer_argsort_both, "Argsort integer-time jobs by end and by start time, returning (end_perm, start_perm)", py::arg("jobs"));
     m.def("float_sort_both_with_indices", &float_sort_both_with_indices, "Sort jobs by both end and start times with indices in one call", py::arg("jobs"));
     m.def("float_sort_both_with_indices_optimized", &float_sort_both_with_indices_optimized, "Optimized version with reduced allocations", py::arg("jobs"));
+    m.def("gpi_solve", &gpi_solve_arrays, "Fused GPI solve over start, end and weight NumPy columns", py::arg("starts"), py::arg("ends"), py::arg("weights"), py::arg("return_jobs") = false);
+    m.def("gpi_solve", &gpi_solve_array, "Fused GPI solve over an (n, 3) NumPy array", py::arg("jobs"), py::arg("return_jobs") = false);
+    m.def("gpi_solve", &gpi_solve, "Fused GPI solve: both sorts, predecessor merge and DP in one call", py::arg("jobs"), py::arg("return_jobs") = false);
+    m.def("gpi_solve_int", &gpi_solve_int_arrays, "Fused GPI solve with integer_sort over integer start and end NumPy columns", py::arg("starts"), py::arg("ends"), py::arg("weights"), py::arg("return_jobs") = false);
+    m.def("gpi_solve_int", &gpi_solve_int_array, "Fused GPI solve with integer_sort over an (n, 3) integer NumPy array", py::arg("jobs"), py::arg("return_jobs") = false);
+    m.def("gpi_solve_int", &gpi_solve_int, "Fused GPI solve with integer_sort for integer start and end times", py::arg("jobs"), py::arg("return_jobs") = false);
 }
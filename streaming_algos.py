@@ -0,0 +1,701 @@
+# Copyright 2025 Amit Joshi
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Author: Amit Joshi
+# Email 1: amitjoshi2724@gmail.com
+# Email 2: amit.joshiusa@gmail.com
+# GitHub: https://github.com/amitjoshi2724
+
+import heapq
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+
+from scheduling_algos import (_argsort, _cap_predecessors, _gpi_dp_multi, _gpi_predecessors, _job_column, _start_perm,
+                              _traceback, _traceback_multi, _zero_length_last_perm)
+
+# Galloping bisect_right: number of entries of the sorted list `ends` that are <= start.
+# Probes backwards from the tail in steps of 1, 2, 4, ... and then binary searches the
+# last step, so the cost is O(log d) where d is how far back the predecessor lies.
+# Streams of short jobs have their predecessor near the tail, making this O(1) amortized.
+def gallop_count_le(ends, start):
+    hi = len(ends)
+    step = 1
+    lo = hi - step
+    while lo > 0 and ends[lo] > start:
+        hi = lo
+        step *= 2
+        lo = hi - step
+    return bisect_right(ends, start, max(lo, 0), hi)
+
+
+# Online GPI for jobs that arrive (roughly) in end-time order. Each append extends
+# the end list, p and dp by one entry instead of re-solving the whole instance.
+# Jobs may arrive out of order by up to `reorder_window` positions: they wait in a
+# small min-heap keyed by end time and are committed once the heap overflows.
+# Zero-length jobs go last among equal ends, as in the batch solvers: the heap orders
+# them after the other buffered jobs with the same end, and a job committed after a run
+# of zero-length jobs with its end is inserted ahead of that run, so equal-end arrivals
+# may come in any order.
+class OnlineGPIScheduler:
+    def __init__(self, reorder_window=0):
+        if reorder_window < 0:
+            raise ValueError("reorder_window must be non-negative")
+        self.reorder_window = reorder_window
+        self._ends = []  # committed end times, nondecreasing
+        self._starts = []
+        self._weights = []
+        self._ids = []  # arrival index of each committed job
+        self._p = [0]  # 1-indexed predecessor counts, p[0] unused
+        self._dp = [0]  # dp[0] = 0
+        self._buffer = []  # reorder heap of (end, zero-length, arrival index, start, weight)
+        self._arrivals = 0
+
+    def __len__(self):
+        return self._arrivals
+
+    # Add a job; returns its arrival index, which is how schedule() refers to it
+    def append(self, start, end, weight):
+        if self._ends and end < self._ends[-1]:
+            raise ValueError(f"job ending at {end} arrived after a job ending at {self._ends[-1]} was committed; "
+                             f"increase reorder_window")
+        job_id = self._arrivals
+        self._arrivals += 1
+        heapq.heappush(self._buffer, (end, start >= end, job_id, start, weight))
+        while len(self._buffer) > self.reorder_window:
+            self._commit(*heapq.heappop(self._buffer))
+        return job_id
+
+    # Commit every buffered job, e.g. at the end of the stream
+    def flush(self):
+        while self._buffer:
+            self._commit(*heapq.heappop(self._buffer))
+
+    def _commit(self, end, zero_length, job_id, start, weight):
+        pred = gallop_count_le(self._ends, start)
+        k = len(self._ends) if zero_length else self._zero_length_run(end)
+        self._ends.insert(k, end)
+        self._starts.insert(k, start)
+        self._weights.insert(k, weight)
+        self._ids.insert(k, job_id)
+        self._p.insert(k + 1, pred)
+        self._dp.append(0)
+        for i in range(k + 1, len(self._dp)):
+            if i > k + 1:
+                self._p[i] += 1  # the inserted job ends before every zero-length job after it
+            self._dp[i] = max(self._dp[i - 1], self._weights[i - 1] + self._dp[self._p[i]])
+
+    # Position of the trailing run of committed zero-length jobs ending at `end`
+    # (len(self._ends) if there is none)
+    def _zero_length_run(self, end):
+        k = len(self._ends)
+        while k and self._ends[k - 1] == end and self._starts[k - 1] >= end:
+            k -= 1
+        return k
+
+    # Current optimum over every appended job, including those still in the reorder buffer
+    @property
+    def optimum(self):
+        if not self._buffer:
+            return self._dp[-1]
+        # The trailing zero-length run may have to follow buffered jobs with its end, so it
+        # is replayed with them
+        ends, dp = self._ends, self._dp
+        k = self._zero_length_run(ends[-1]) if ends else 0
+        replayed = [(ends[i], True, 0, self._starts[i], self._weights[i]) for i in range(k, len(ends))]
+        extra_ends, extra_dp = [], []
+        for end, _, _, start, weight in sorted(replayed + self._buffer):
+            pred = min(gallop_count_le(ends, start), k)
+            if pred == k:  # predecessors may also be among the buffered jobs
+                pred += bisect_right(extra_ends, start)
+            best = extra_dp[-1] if extra_dp else dp[k]
+            before = dp[pred] if pred <= k else extra_dp[pred - k - 1]
+            extra_ends.append(end)
+            extra_dp.append(max(best, weight + before))
+        return extra_dp[-1]
+
+    # Arrival indices of an optimal schedule over the committed jobs, in end order
+    def schedule(self):
+        return [self._ids[i - 1] for i in _traceback(self._dp, self._p.__getitem__)]
+
+
+# Bounded-memory GPI pass over an iterable of jobs sorted by end time, where every job
+# lasts at most max_duration. Equal ends may come in any order: zero-length jobs go last
+# among them, as in the batch solvers, so a job arriving after a run of zero-length jobs
+# with its end is solved ahead of that run, which is then replayed. Since start_i >= end_i - max_duration, every end at or
+# before end_i - max_duration is a predecessor of job i and of all later jobs, so only
+# dp at that boundary is needed. Older entries are dropped from a sliding buffer that
+# is compacted once half of it is stale, so memory is O(max number of ends within any
+# window of length max_duration) instead of O(n).
+# Returns the optimum, or (optimum, peak buffer length) with return_peak.
+def gpi_stream_bounded_duration(jobs, max_duration, return_peak=False):
+    ends, dps = [], []  # live window: end times and dp after each of those jobs
+    head = 0  # entries before head are stale
+    base_dp = 0  # dp after the last evicted job
+    peak = 0
+    last_end = None
+    zero_run = []  # trailing zero-length jobs ending at last_end
+    for start, end, weight in jobs:
+        if last_end is not None and end < last_end:
+            raise ValueError(f"jobs must be sorted by end time: {end} after {last_end}")
+        if end - start > max_duration:
+            raise ValueError(f"job ({start}, {end}) is longer than max_duration={max_duration}")
+        if end != last_end:
+            zero_run = []
+        last_end = end
+
+        # Evict ends that every remaining job starts after
+        horizon = end - max_duration
+        while head < len(ends) and ends[head] <= horizon:
+            base_dp = dps[head]
+            head += 1
+        if head > 64 and head * 2 > len(ends):
+            del ends[:head], dps[:head]
+            head = 0
+
+        if start >= end:
+            zero_run.append((start, weight))
+            replay = [(start, weight)]
+        else:
+            # The run ends after the eviction horizon, so it is still in the buffer
+            del ends[len(ends) - len(zero_run):], dps[len(dps) - len(zero_run):]
+            replay = [(start, weight)] + zero_run
+        for start, weight in replay:
+            k = bisect_right(ends, start, head, len(ends))
+            include = weight + (dps[k - 1] if k > head else base_dp)
+            best = dps[-1] if len(ends) > head else base_dp
+            ends.append(end)
+            dps.append(max(best, include))
+        peak = max(peak, len(ends) - head)
+
+    optimum = dps[-1] if len(ends) > head else base_dp
+    return (optimum, peak) if return_peak else optimum
+
+
+# Backward DP over jobs sorted by start: best[k] = optimum over jobs k.. (in start order).
+# succ[k] is the first position whose start is >= end k.
+def _backward_dp(starts, ends, weights, succ):
+    best = [0] * (len(starts) + 1)
+    for k in range(len(starts) - 1, -1, -1):
+        best[k] = max(best[k + 1], weights[k] + best[succ[k]])
+    return best
+
+
+# The same backward DP with one column per limit in `limits` (a NumPy array): column c only
+# takes jobs ending at or before limits[c]. Each step updates every column at once.
+def _backward_dp_columns(starts, ends, weights, succ, limits, dtype):
+    best = np.zeros((len(starts) + 1, len(limits)), dtype=dtype)
+    if not len(limits):
+        return best
+    for k in range(len(starts) - 1, -1, -1):
+        include = np.where(ends[k] <= limits, weights[k] + best[succ[k]], best[k + 1])
+        np.maximum(best[k + 1], include, out=best[k])
+    return best
+
+
+# Rolling-horizon GPI: the optimum over jobs inside a moving window
+# [now, now + horizon] (start >= now and end <= now + horizon), re-evaluated as `now`
+# advances. Every job must last at most max_duration.
+#
+# The window is split at a pivot time m = max(now, now + horizon - max_duration) taken
+# at the last rebuild, like the two-stack sliding-window technique:
+#   * old jobs (end <= m) get a backward DP from m, so expiring them at the trailing
+#     edge is just a query at the new `now`;
+#   * new jobs (start >= m, end > m) get a forward DP from m, so admitting them at the
+#     leading edge appends to its tail (or recomputes the suffix after a late insertion);
+#     a zero-length job at m is an old job only, so no job is counted on both sides;
+#   * crossing jobs (start < m < end) are known at the rebuild, because later admissions
+#     end after now + horizon and so start after m. A schedule uses at most one of them,
+#     so each gets its own old-side and new-side DP column.
+# A full rebuild only happens once `now` passes m (once per horizon - max_duration time
+# units) or when a job submitted late lands before m. Otherwise admissions are batched
+# per tick and only the DP suffix after the earliest admitted job is recomputed, so
+# per-tick cost is proportional to the churn (times the number of crossing jobs)
+# rather than to the window size.
+class RollingHorizonScheduler:
+    def __init__(self, horizon, max_duration, now=0):
+        if max_duration <= 0 or horizon <= 0:
+            raise ValueError("horizon and max_duration must be positive")
+        self.horizon = horizon
+        self.max_duration = max_duration
+        self.now = now
+        self._pending = []  # heap of (end, job id, start, weight) not yet inside the window
+        self._next_id = 0
+        self._rebuild([])
+
+    @property
+    def window_end(self):
+        return self.now + self.horizon
+
+    # Add a job; it is admitted once it fits in the window and dropped once its start passes
+    def submit(self, start, end, weight):
+        if end - start > self.max_duration:
+            raise ValueError(f"job ({start}, {end}) is longer than max_duration={self.max_duration}")
+        job_id = self._next_id
+        self._next_id += 1
+        heapq.heappush(self._pending, (end, job_id, start, weight))
+        return job_id
+
+    # Move the window to [now, now + horizon]: expire at the trailing edge, admit at the leading edge
+    def advance(self, now):
+        if now < self.now:
+            raise ValueError("the window can only move forward")
+        self.now = now
+        self._admit()
+
+    # Admit every pending job that fits in the window, as one batch
+    def _admit(self):
+        admitted = []
+        while self._pending and self._pending[0][0] <= self.window_end:
+            end, job_id, start, weight = heapq.heappop(self._pending)
+            if start >= self.now:
+                admitted.append((start, end, weight, job_id))
+
+        # Rebuild once the trailing edge passes the pivot (all old and crossing jobs have
+        # expired), or if a late admission would cross it; otherwise only extend the new side
+        if self.now > self._pivot or any(job[0] < self._pivot for job in admitted):
+            self._rebuild(self._window_jobs() + admitted)
+        elif admitted:
+            first = len(self._new_ends)
+            for start, end, weight, job_id in admitted:
+                first = min(first, self._insert_new(start, end, weight, job_id))
+            self._recompute_new_from(first)
+
+    # Optimum over the jobs currently inside the window
+    @property
+    def optimum(self):
+        self._admit()
+        lo = bisect_left(self._old_starts, self.now)
+        best = self._old_best[lo] + self._new_best[-1]
+        live = self._cross_starts >= self.now
+        if live.any():
+            through = self._cross_old_best[lo] + self._cross_weights + self._cross_new_best[-1]
+            best = max(best, through[live].max().item())
+        return best
+
+    def _window_jobs(self):
+        jobs = [job for job in zip(self._old_starts, self._old_ends, self._old_weights, self._old_ids)
+                if job[0] >= self.now]
+        jobs.extend(job for job in self._crossing_jobs if job[0] >= self.now)
+        jobs.extend(job for job in zip(self._new_starts, self._new_ends, self._new_weights, self._new_ids)
+                    if job[0] >= self.now)
+        return jobs
+
+    def _rebuild(self, jobs):
+        self._pivot = pivot = max(self.now, self.window_end - self.max_duration)
+
+        # Zero-length jobs go first among equal starts on the old side and last among equal
+        # ends on the new side, so each DP reaches every job compatible with them
+        old = sorted((job for job in jobs if job[1] <= pivot), key=lambda job: (job[0], job[1] > job[0]))
+        self._old_starts = [job[0] for job in old]
+        self._old_ends = [job[1] for job in old]
+        self._old_weights = [job[2] for job in old]
+        self._old_ids = [job[3] for job in old]
+        succ = [max(bisect_left(self._old_starts, end), k + 1) for k, end in enumerate(self._old_ends)]
+        self._old_best = _backward_dp(self._old_starts, self._old_ends, self._old_weights, succ)
+
+        new = sorted((job for job in jobs if job[0] >= pivot and job[1] > pivot), key=lambda job: (job[1], job[0] >= job[1]))
+        self._new_starts = [job[0] for job in new]
+        self._new_ends = [job[1] for job in new]
+        self._new_weights = [job[2] for job in new]
+        self._new_ids = [job[3] for job in new]
+        self._new_p = [0]  # 1-indexed predecessor counts among new jobs, p[0] unused
+        self._new_best = [0]
+
+        # Crossing jobs are the columns of one DP table per side, so each step of the
+        # old-side and new-side DPs updates all of them with a single vectorized operation
+        self._crossing_jobs = crossing = [job for job in jobs if job[0] < pivot < job[1]]
+        self._cross_starts = np.array([job[0] for job in crossing], dtype=float)
+        self._cross_ends = np.array([job[1] for job in crossing], dtype=float)
+        dtype = np.array([job[2] for job in jobs] + [0]).dtype
+        self._cross_weights = np.array([job[2] for job in crossing], dtype=dtype)
+        self._cross_old_best = _backward_dp_columns(
+            self._old_starts, self._old_ends, self._old_weights, succ, self._cross_starts,
+            dtype)
+        self._cross_new_best = [np.zeros(len(crossing), dtype=dtype)]
+        self._recompute_new_from(0)
+
+    # Insert a job with start >= pivot into the new side; returns its end-order position,
+    # from which the DP suffix has to be recomputed
+    def _insert_new(self, start, end, weight, job_id):
+        k = bisect_right(self._new_ends, end)
+        while start < end and k and self._new_ends[k - 1] == end and self._new_starts[k - 1] >= end:
+            k -= 1  # ahead of zero-length jobs with the same end
+        self._new_starts.insert(k, start)
+        self._new_ends.insert(k, end)
+        self._new_weights.insert(k, weight)
+        self._new_ids.insert(k, job_id)
+        if isinstance(weight, (float, np.floating)) and self._cross_weights.dtype.kind != 'f':
+            # A fractional weight after an all-integer rebuild: widen the crossing DP tables
+            self._cross_weights = self._cross_weights.astype(float)
+            self._cross_old_best = self._cross_old_best.astype(float)
+            self._cross_new_best = [row.astype(float) for row in self._cross_new_best]
+        return k
+
+    # Forward DP over new jobs from end-order position k onward, for the shared DP and
+    # for every crossing job (which may only be followed by new jobs starting after it ends)
+    def _recompute_new_from(self, k):
+        del self._new_p[k + 1:], self._new_best[k + 1:], self._cross_new_best[k + 1:]
+        cross_new_best, cross_ends = self._cross_new_best, self._cross_ends
+        ends = self._new_ends
+        last_empty = cross_new_best[0]
+        for i in range(k, len(ends)):
+            start, weight = self._new_starts[i], self._new_weights[i]
+            pred = bisect_right(ends, start, 0, i)
+            self._new_p.append(pred)
+            self._new_best.append(max(self._new_best[-1], weight + self._new_best[pred]))
+            if len(cross_ends):
+                last = cross_new_best[-1]
+                include = np.where(start >= cross_ends, weight + cross_new_best[pred], last)
+                cross_new_best.append(np.maximum(last, include))
+            else:
+                cross_new_best.append(last_empty)
+
+
+# A solved instance whose job intervals are fixed but whose weights change. The end
+# order and p depend only on the intervals, so they are computed once; a batch of
+# weight edits then recomputes dp only from the smallest edited end-order position on.
+# The recomputation stops early at the first position i where
+#   * dp[i] equals its old value,
+#   * no edited job lies after i, and
+#   * no job after i has its predecessor at a position whose dp value changed
+#     (reach[q] is the last end-order position whose predecessor is q).
+# Past that point every input of every later dp entry is unchanged. Edits near the tail
+# of the horizon therefore cost O(batch) instead of a full re-sort and re-solve.
+class PreparedGPIInstance:
+    def __init__(self, jobs, sortAlgo='default'):
+        n = len(jobs)
+        self._end_perm = []  # end order -> original index
+        self._position = [0] * n  # original index -> 1-indexed end-order position
+        self._p = [0]  # 1-indexed predecessors, p[0] unused
+        if n:
+            starts, ends = _job_column(jobs, 0), _job_column(jobs, 1)
+            end_perm = _zero_length_last_perm(_argsort(ends, sortAlgo), starts, ends)
+            start_perm = _start_perm(starts, end_perm, sortAlgo)
+            p_by_job = np.empty(n, dtype=np.int64)
+            p_by_job[start_perm] = _gpi_predecessors(ends[end_perm], starts[start_perm])
+            self._end_perm = end_perm.tolist()
+            self._p += _cap_predecessors(p_by_job[end_perm]).tolist()
+            for i, k in enumerate(self._end_perm, 1):
+                self._position[k] = i
+
+        self._reach = [0] * (n + 1)
+        for i in range(1, n + 1):
+            self._reach[self._p[i]] = i  # positions ascend, so the last write is the max
+        self._weights = [0] + [jobs[k][2] for k in self._end_perm]  # 1-indexed, end order
+        self._dp = [0] * (n + 1)
+        self.recomputed = 0  # dp entries recomputed by the last solve or update
+        self._recompute(1, n)
+
+    def __len__(self):
+        return len(self._end_perm)
+
+    @property
+    def optimum(self):
+        return self._dp[-1]
+
+    def weight(self, index):
+        return self._weights[self._position[index]]
+
+    # Apply {original index: new weight} (or (index, weight) pairs) and return the new optimum
+    def update_weights(self, updates):
+        items = updates.items() if hasattr(updates, 'items') else updates
+        edited = set()
+        for index, weight in items:
+            i = self._position[index]
+            if weight != self._weights[i]:
+                self._weights[i] = weight
+                edited.add(i)
+        self.recomputed = 0
+        if edited:
+            self._recompute(min(edited), max(edited))
+        return self.optimum
+
+    # Optima of K weighting scenarios over this instance's intervals, with the DP
+    # vectorized across scenarios (see gpi_weighted_job_scheduling_multi). weights is an
+    # (n, K) matrix in the original job order; the instance's own weights are untouched.
+    def solve_weight_matrix(self, weights, return_jobs=False):
+        weights = np.asarray(weights)
+        if weights.ndim != 2 or weights.shape[0] != len(self):
+            raise ValueError(f"expected an ({len(self)}, K) weight matrix")
+        end_perm = np.array(self._end_perm, dtype=np.int64)
+        p = np.array(self._p[1:], dtype=np.int64)
+        dp = _gpi_dp_multi(p, weights[end_perm])
+        if return_jobs:
+            return dp[-1].copy(), _traceback_multi(dp, p, end_perm)
+        return dp[-1].copy()
+
+    # Indices of an optimal schedule in the original job order, sorted by end time
+    def schedule(self):
+        end_perm = self._end_perm
+        return [end_perm[i - 1] for i in _traceback(self._dp, self._p.__getitem__)]
+
+    # Recompute dp from position `first`; entries up to `horizon` may change regardless
+    def _recompute(self, first, horizon):
+        dp, p, weights, reach = self._dp, self._p, self._weights, self._reach
+        count = 0
+        for i in range(first, len(dp)):
+            count += 1
+            include = weights[i] + dp[p[i]]
+            new = include if include > dp[i - 1] else dp[i - 1]
+            if new != dp[i]:
+                dp[i] = new
+                if reach[i] > horizon:
+                    horizon = reach[i]
+            elif i >= horizon:
+                break
+        self.recomputed = count
+
+
+_INF = float('inf')
+
+
+# Sorted list of comparable keys stored as a list of sorted blocks of at most
+# 2 * load keys, with each block's maximum in `maxes` (sqrt-decomposition, in the style
+# of sortedcontainers). Lookups bisect `maxes` and then one block; add/remove shift at
+# most one block, so updates cost O(log n + load) with small constants.
+class _SortedBlocks:
+    def __init__(self, keys=(), load=512):
+        keys = sorted(keys)
+        self._load = load
+        self._blocks = [keys[i:i + load] for i in range(0, len(keys), load)]
+        self._maxes = [block[-1] for block in self._blocks]
+        self._len = len(keys)
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        for block in self._blocks:
+            yield from block
+
+    def __reversed__(self):
+        for block in reversed(self._blocks):
+            yield from reversed(block)
+
+    def add(self, key):
+        self._len += 1
+        if not self._blocks:
+            self._blocks.append([key])
+            self._maxes.append(key)
+            return
+        b = min(bisect_left(self._maxes, key), len(self._blocks) - 1)
+        block = self._blocks[b]
+        block.insert(bisect_left(block, key), key)
+        self._maxes[b] = block[-1]
+        if len(block) > 2 * self._load:
+            self._blocks[b:b + 1] = [block[:self._load], block[self._load:]]
+            self._maxes[b:b + 1] = [block[self._load - 1], block[-1]]
+
+    def remove(self, key):
+        b = bisect_left(self._maxes, key)
+        block = self._blocks[b]
+        del block[bisect_left(block, key)]
+        self._len -= 1
+        if block:
+            self._maxes[b] = block[-1]
+        else:
+            del self._blocks[b], self._maxes[b]
+
+    # Largest key < key, or None
+    def before(self, key):
+        b = bisect_left(self._maxes, key)
+        if b < len(self._blocks):
+            i = bisect_left(self._blocks[b], key)
+            if i:
+                return self._blocks[b][i - 1]
+        return self._blocks[b - 1][-1] if b else None
+
+    # Smallest key > key, or None
+    def after(self, key):
+        b = bisect_right(self._maxes, key)
+        if b == len(self._blocks):
+            return None
+        block = self._blocks[b]
+        return block[bisect_right(block, key)]
+
+    def last(self):
+        return self._maxes[-1] if self._maxes else None
+
+    # Keys with lo <= key < hi (hi=None: no upper bound), ascending
+    def irange(self, lo, hi=None):
+        b = bisect_left(self._maxes, lo)
+        if b == len(self._blocks):
+            return
+        i = bisect_left(self._blocks[b], lo)
+        for block in self._blocks[b:]:
+            for key in block[i:] if i else block:
+                if hi is not None and key >= hi:
+                    return
+                yield key
+            i = 0
+
+
+# Fully dynamic GPI: jobs are inserted and removed at any time. Jobs are indexed by
+# (end, zero-length, id) and (start, id) in blocked sorted arrays, so zero-length jobs
+# go last among equal ends as in the batch solvers. Each job stores its GPI predecessor
+# as a reference to a job (the last one before it in end order with end <= its start)
+# rather than as a position, so an insert or remove at end time e only re-points the
+# jobs whose pointer crosses e: those starting in [e, next end after e), found with one
+# range query on the start index, and a zero-length job right after it in end order.
+# Mutations are O(log n + load + repaired jobs).
+#
+# dp is recomputed lazily, on the next query, from the first affected job in end order,
+# and stops early like PreparedGPIInstance: once past every mutated job, at the first
+# job whose dp value is unchanged, unless a later job may depend on a changed dp value.
+# Jobs depending on job q start before the next end after q, so they end within
+# max_duration of it, which bounds the check without per-job lookups. A query therefore
+# costs time proportional to the span over which dp actually changed.
+class DynamicGPIScheduler:
+    def __init__(self, jobs=(), load=512):
+        self._jobs = {}  # id -> (start, end, weight)
+        self._pred = {}  # id -> predecessor id, or None
+        self._dp = {}  # id -> best weight over jobs up to this one in end order
+        self._next_id = 0
+        self._max_duration = 0  # longest job ever added, bounds how far dp changes can reach
+        for start, end, weight in jobs:
+            self._check(start, end)
+            self._max_duration = max(self._max_duration, end - start)
+            self._jobs[self._next_id] = (start, end, weight)
+            self._next_id += 1
+        self._by_end = _SortedBlocks((self._key(i) for i in self._jobs), load)
+        self._by_start = _SortedBlocks(((job[0], i) for i, job in self._jobs.items()), load)
+
+        # Initial predecessors with one GPI merge of the two sorted indexes
+        ends = iter(self._by_end)
+        last = None
+        following = next(ends, None)
+        for start, i in self._by_start:
+            while following is not None and following[0] <= start:
+                last, following = following, next(ends, None)
+            pred = last
+            if pred is not None and pred >= self._key(i):  # zero-length: only jobs before it
+                pred = self._by_end.before(self._key(i))
+            self._pred[i] = pred[2] if pred else None
+
+        self._dirty = next(iter(self._by_end), None)  # end index key to recompute dp from
+        self._horizon = self._by_end.last()  # dp may change up to here regardless
+
+    def __len__(self):
+        return len(self._jobs)
+
+    def __contains__(self, job_id):
+        return job_id in self._jobs
+
+    @staticmethod
+    def _check(start, end):
+        if not end >= start:
+            raise ValueError(f"job ({start}, {end}) must not end before it starts")
+
+    # Position of a job in the end index
+    def _key(self, job_id):
+        start, end, _ = self._jobs[job_id]
+        return (end, start >= end, job_id)
+
+    # Add a job; returns its id
+    def insert(self, start, end, weight):
+        self._check(start, end)
+        self._max_duration = max(self._max_duration, end - start)
+        job_id = self._next_id
+        self._next_id += 1
+        self._jobs[job_id] = (start, end, weight)
+        key = self._key(job_id)
+        self._by_end.add(key)
+        self._by_start.add((start, job_id))
+        previous = self._by_end.before(min((start, _INF), key))
+        self._pred[job_id] = previous[2] if previous else None
+        for dependent in self._dependents(key):
+            self._pred[dependent] = job_id
+            self._mark(self._key(dependent))
+        self._mark(key)
+        return job_id
+
+    # Cancel a job by id
+    def remove(self, job_id):
+        start, end, weight = self._jobs[job_id]
+        key = self._key(job_id)
+        previous = self._by_end.before(key)
+        for dependent in self._dependents(key):
+            self._pred[dependent] = previous[2] if previous else None
+            self._mark(self._key(dependent))
+        following = self._by_end.after(key)
+        self._by_end.remove(key)
+        self._by_start.remove((start, job_id))
+        del self._jobs[job_id], self._pred[job_id]
+        self._dp.pop(job_id, None)
+        if following is not None:
+            self._mark(following)
+
+    def update_weight(self, job_id, weight):
+        start, end, _ = self._jobs[job_id]
+        self._jobs[job_id] = (start, end, weight)
+        self._mark(self._key(job_id))
+
+    @property
+    def optimum(self):
+        self._refresh()
+        last = self._by_end.last()
+        return self._dp[last[2]] if last else 0
+
+    # Ids of an optimal schedule, sorted by end time
+    def schedule(self):
+        self._refresh()
+        order = [key[2] for key in self._by_end]
+        position = {i: k for k, i in enumerate(order, 1)}
+        dp = [0] + [self._dp[i] for i in order]
+        pred = self._pred
+        selected = _traceback(dp, lambda k: position[pred[order[k - 1]]] if pred[order[k - 1]] is not None else 0)
+        return [order[k - 1] for k in selected]
+
+    # Jobs whose predecessor is the job at `key` (or would be, for a new job): later jobs
+    # starting in [end, next end), and the next job if it is zero-length
+    def _dependents(self, key):
+        following = self._by_end.after(key)
+        hi = (following[0], -_INF) if following is not None else None
+        dependents = [i for _, i in self._by_start.irange((key[0], -_INF), hi) if self._key(i) > key]
+        if following is not None and following[1]:
+            dependents.append(following[2])
+        return dependents
+
+    def _mark(self, key):
+        if self._dirty is None or key < self._dirty:
+            self._dirty = key
+        if self._horizon is None or key > self._horizon:
+            self._horizon = key
+
+    def _refresh(self):
+        if self._dirty is None:
+            return
+        jobs, pred, dp = self._jobs, self._pred, self._dp
+        horizon = self._horizon
+        # Jobs depending on a changed job q start before the end of the job after q, so
+        # they end before that end + max_duration; sweep at least that far
+        reach = -_INF
+        changed = False
+        previous = self._by_end.before(self._dirty)
+        best = dp[previous[2]] if previous else 0
+        for key in self._by_end.irange(self._dirty):
+            end, _, i = key
+            if changed and end + self._max_duration > reach:
+                reach = end + self._max_duration
+            q = pred[i]
+            include = jobs[i][2] + (dp[q] if q is not None else 0)
+            if include > best:
+                best = include
+            changed = dp.get(i) != best
+            if changed:
+                dp[i] = best
+            elif key >= horizon and end >= reach:
+                break
+        self._dirty = self._horizon = None